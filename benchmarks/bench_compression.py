@@ -0,0 +1,39 @@
+"""
+Benchmark of the input throughput for plain text versus gzip, bz2 and xz compressed input.
+
+Run from the project root:
+
+    python -m benchmarks.bench_compression
+"""
+import bz2
+import gzip
+import io
+import lzma
+import time
+from src.main.utils.stream_util import StreamUtil
+
+LINE = ('[' + ','.join(['{"operation":"buy", "unit-cost":10.00, "quantity": 10000}',
+                        '{"operation":"sell", "unit-cost":20.00, "quantity": 5000}'] * 50) + ']\n')
+NUMBER_OF_LINES = 20000
+
+
+def bench(name: str, payload: bytes, raw_size: int) -> None:
+    start = time.perf_counter()
+    lines = 0
+    for _ in StreamUtil.open_input(io.BytesIO(payload)):
+        lines += 1
+    elapsed = time.perf_counter() - start
+    print(f"{name:>6}: {len(payload) / 1e6:8.2f} MB on input, {lines} lines, "
+          f"{elapsed:.3f}s, {raw_size / 1e6 / elapsed:8.1f} MB/s of text")
+
+
+def main() -> None:
+    data = (LINE * NUMBER_OF_LINES).encode()
+    bench("plain", data, len(data))
+    bench("gzip", gzip.compress(data), len(data))
+    bench("bz2", bz2.compress(data), len(data))
+    bench("xz", lzma.compress(data), len(data))
+
+
+if __name__ == "__main__":
+    main()
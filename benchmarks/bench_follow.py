@@ -0,0 +1,57 @@
+"""
+Benchmark of the follow mode: latency from appending a line to its result being written, and CPU
+time used while the input file is idle.
+
+Run from the project root:
+
+    python -m benchmarks.bench_follow
+"""
+import os
+import statistics
+import tempfile
+import threading
+import time
+from src.main.services.follow_service import FollowService
+
+LINE = '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000},{"operation":"sell", "unit-cost":20.00, "quantity": 5000}]\n'
+APPENDS = 20
+IDLE_SECONDS = 3.0
+
+
+def output_lines(path: str) -> int:
+    if not os.path.exists(path):
+        return 0
+    with open(path) as output_file:
+        return sum(1 for _ in output_file)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = os.path.join(directory, "operations.txt")
+        output_path = os.path.join(directory, "taxes.txt")
+        open(input_path, "w").close()
+        follow_service = FollowService(input_path, output_path)
+        threading.Thread(target=follow_service.follow, daemon=True).start()
+
+        latencies = []
+        for index in range(APPENDS):
+            # Lets the poll interval back off, as it would between bursts of appends
+            time.sleep(0.3)
+            start = time.perf_counter()
+            with open(input_path, "a") as input_file:
+                input_file.write(LINE)
+            while output_lines(output_path) <= index:
+                time.sleep(0.001)
+            latencies.append(time.perf_counter() - start)
+        print(f"append to result latency: median {statistics.median(latencies) * 1000:.1f} ms, "
+              f"max {max(latencies) * 1000:.1f} ms")
+
+        start_cpu = time.process_time()
+        time.sleep(IDLE_SECONDS)
+        idle_cpu = time.process_time() - start_cpu
+        print(f"idle CPU: {idle_cpu * 1000:.2f} ms over {IDLE_SECONDS:.0f} s "
+              f"({idle_cpu / IDLE_SECONDS * 100:.3f}%)")
+
+
+if __name__ == "__main__":
+    main()
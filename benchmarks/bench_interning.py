@@ -0,0 +1,49 @@
+"""
+Benchmark of parsing a skewed workload (a few operation shapes repeated many times) with and
+without the OperationInterner: parsing time and memory retained by the parsed operations.
+
+Run from the project root:
+
+    python -m benchmarks.bench_interning
+"""
+import random
+import time
+import tracemalloc
+from src.main.utils.operation_util import OperationUtil, OperationInterner
+
+NUMBER_OF_LINES = 200
+OPERATIONS_PER_LINE = 2000
+DISTINCT_SHAPES = 500
+
+
+def build_lines() -> list[str]:
+    generator = random.Random(42)
+    shapes = [f'{{"operation":"{"buy" if index % 2 else "sell"}", "unit-cost":{10 + index % 50}.00, '
+              f'"quantity": {100 * (1 + index // 50)}}}' for index in range(DISTINCT_SHAPES)]
+    # Zipf-like skew: a handful of shapes account for most operations
+    weights = [1 / (rank + 1) ** 1.2 for rank in range(DISTINCT_SHAPES)]
+    return ["[" + ",".join(generator.choices(shapes, weights, k=OPERATIONS_PER_LINE)) + "]\n"
+            for _ in range(NUMBER_OF_LINES)]
+
+
+def bench(name: str, lines: list[str], interner) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    operations = OperationUtil.format_operations_file(lines, interner=interner)
+    elapsed = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:>10}: {elapsed:.3f}s, retained {retained / 1e6:7.2f} MB for "
+          f"{sum(map(len, operations))} operations")
+    if interner is not None:
+        print(f"{'':>10}  {interner.stats()}")
+
+
+def main() -> None:
+    lines = build_lines()
+    bench("plain", lines, None)
+    bench("interned", lines, OperationInterner())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark of the k-way merge of tagged operation files versus concatenating, sorting and grouping
+them by account before calculating the taxes: time and peak memory.
+
+Run from the project root:
+
+    python -m benchmarks.bench_merge
+"""
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from src.main.dto.operation_dto import OperationDto
+from src.main.services.merge_service import MergeService
+from src.main.services.tax_service import TaxService
+
+NUMBER_OF_FILES = 16
+OPERATIONS_PER_FILE = 20000
+NUMBER_OF_ACCOUNTS = 100
+
+
+class NullOutput:
+    """
+    Output that discards the written text, so only the merge and the computation are measured.
+    """
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+def write_files(directory: str) -> list[str]:
+    generator = random.Random(42)
+    paths = []
+    for index in range(NUMBER_OF_FILES):
+        path = os.path.join(directory, f"venue{index}.jsonl")
+        timestamp = 0
+        with open(path, "w") as file:
+            for _ in range(OPERATIONS_PER_FILE):
+                timestamp += generator.randint(1, 10)
+                file.write(json.dumps({
+                    "timestamp": timestamp,
+                    "account": f"account{generator.randrange(NUMBER_OF_ACCOUNTS)}",
+                    "operation": generator.choice(("buy", "sell")),
+                    "unit-cost": float(generator.randint(5, 30)),
+                    "quantity": generator.randint(1, 5000),
+                }) + "\n")
+        paths.append(path)
+    return paths
+
+
+def sort_and_group(paths: list[str]) -> None:
+    records = []
+    for path in paths:
+        with open(path) as file:
+            records.extend(json.loads(line) for line in file)
+    records.sort(key=lambda record: record["timestamp"])
+    accounts = {}
+    for record in records:
+        accounts.setdefault(record["account"], []).append(OperationDto.from_dict(record))
+    tax_service = TaxService()
+    for operations in accounts.values():
+        NullOutput().write(str(tax_service.calculate_taxes(operations)))
+
+
+def bench(name: str, run) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:>14}: {elapsed:.3f}s, peak memory {peak / 1e6:8.2f} MB")
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_files(directory)
+        print(f"{NUMBER_OF_FILES} files x {OPERATIONS_PER_FILE} operations, {NUMBER_OF_ACCOUNTS} accounts")
+        bench("sort and group", lambda: sort_and_group(paths))
+        bench("k-way merge", lambda: MergeService().process_files(paths, NullOutput()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Benchmark of the tax computation alone versus the tax computation writing to the SQLite sink.
+
+Run from the project root:
+
+    python -m benchmarks.bench_sqlite_sink
+"""
+import os
+import tempfile
+import time
+from src.main.dto.operation_dto import OperationDto
+from src.main.enums.operation_type_enum import OperationTypeEnum
+from src.main.services.operation_service import OperationService
+from src.main.services.sqlite_sink_service import SqliteSinkService
+
+NUMBER_OF_LINES = 10000
+OPERATIONS_PER_LINE = 100
+
+
+def build_operations() -> list[list[OperationDto]]:
+    line = [OperationDto(OperationTypeEnum.BUY, 10.00, 10000),
+            OperationDto(OperationTypeEnum.SELL, 20.00, 5000)] * (OPERATIONS_PER_LINE // 2)
+    return [line] * NUMBER_OF_LINES
+
+
+def main() -> None:
+    operations = build_operations()
+    total = NUMBER_OF_LINES * OPERATIONS_PER_LINE
+    operation_service = OperationService()
+
+    start = time.perf_counter()
+    operation_service.process_operations(operations)
+    elapsed = time.perf_counter() - start
+    print(f"compute only:  {elapsed:.3f}s, {total / elapsed:10.0f} ops/s")
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        with SqliteSinkService(os.path.join(directory, "results.db")) as sink:
+            operation_service.process_operations(operations, sink)
+        elapsed = time.perf_counter() - start
+        print(f"compute+sink:  {elapsed:.3f}s, {total / elapsed:10.0f} ops/s")
+
+
+if __name__ == "__main__":
+    main()
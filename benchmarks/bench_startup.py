@@ -0,0 +1,37 @@
+"""
+Benchmark of the cold-start latency of the CLI for a one-line input, running it as a module and
+as the precompiled zipapp (built with scripts.build_zipapp).
+
+Run from the project root:
+
+    python -m benchmarks.bench_startup
+"""
+import statistics
+import subprocess
+import sys
+import time
+from scripts.build_zipapp import build
+
+LINE = b'[{"operation":"buy", "unit-cost":10.00, "quantity": 10000},{"operation":"sell", "unit-cost":20.00, "quantity": 5000}]\n'
+RUNS = 30
+
+
+def bench(name: str, command: list[str]) -> None:
+    durations = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run(command, input=LINE, stdout=subprocess.DEVNULL, check=True)
+        durations.append(time.perf_counter() - start)
+    print(f"{name:>12}: median {statistics.median(durations) * 1000:7.2f} ms, "
+          f"min {min(durations) * 1000:7.2f} ms")
+
+
+def main() -> None:
+    target = build()
+    bench("interpreter", [sys.executable, "-c", "pass"])
+    bench("module", [sys.executable, "-m", "src.main.main"])
+    bench("zipapp", [sys.executable, target])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark of the peak memory and time to process one very large input line, loading it at once
+versus parsing it incrementally.
+
+Run from the project root:
+
+    python -m benchmarks.bench_stream_parsing
+"""
+import os
+import tempfile
+import time
+import tracemalloc
+from src.main.services.input_service import InputService
+
+OPERATIONS_IN_LINE = 200000
+LINE = ('[' + ','.join(['{"operation":"buy", "unit-cost":10.00, "quantity": 10000}',
+                        '{"operation":"sell", "unit-cost":20.00, "quantity": 5000}'] * (OPERATIONS_IN_LINE // 2)) + ']\n')
+
+
+def bench(name: str, run) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:>8}: {elapsed:.3f}s, peak memory {peak / 1e6:8.2f} MB "
+          f"(line has {len(LINE) / 1e6:.2f} MB)")
+
+
+class NullOutput:
+    """
+    Output that discards the written text, so only the parsing and the computation are measured.
+    """
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+def main() -> None:
+    input_service = InputService()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "input.txt")
+        with open(path, "w") as file:
+            file.write(LINE)
+
+        def load() -> None:
+            with open(path) as file:
+                NullOutput().write(str(input_service.process_input(file.readlines())))
+
+        def stream() -> None:
+            with open(path) as file:
+                input_service.process_stream(file, NullOutput())
+
+        bench("load", load)
+        bench("stream", stream)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Benchmark of the OperationService backends: sequential, thread pool and process pool.
+Run it with both a regular and a free-threaded (e.g. python3.13t) interpreter to choose the
+backend: threads only scale when the GIL is disabled.
+
+Run from the project root:
+
+    python -m benchmarks.bench_threads
+    python3.13t -m benchmarks.bench_threads
+"""
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from src.main.dto.operation_dto import OperationDto
+from src.main.enums.operation_type_enum import OperationTypeEnum
+from src.main.services.operation_service import OperationService
+
+NUMBER_OF_LINES = 2000
+OPERATIONS_PER_LINE = 500
+
+
+def build_operations() -> list[list[OperationDto]]:
+    return [[OperationDto(OperationTypeEnum.BUY, 10.00 + line % 7, 10000),
+             OperationDto(OperationTypeEnum.SELL, 5.00 + line % 11, 5000)] * (OPERATIONS_PER_LINE // 2)
+            for line in range(NUMBER_OF_LINES)]
+
+
+def bench(name: str, operation_service: OperationService, operations: list[list[OperationDto]]) -> None:
+    start = time.perf_counter()
+    operation_service.process_operations(operations)
+    elapsed = time.perf_counter() - start
+    print(f"{name:>12}: {elapsed:.3f}s, {NUMBER_OF_LINES * OPERATIONS_PER_LINE / elapsed:10.0f} ops/s")
+
+
+def main() -> None:
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil_enabled else 'disabled'}, "
+          f"{os.cpu_count()} CPUs")
+    operations = build_operations()
+    bench("sequential", OperationService(), operations)
+    for workers in (2, 4, 8):
+        with ThreadPoolExecutor(workers) as executor:
+            bench(f"threads x{workers}", OperationService(executor=executor), operations)
+    for workers in (2, 4, 8):
+        with ProcessPoolExecutor(workers) as executor:
+            bench(f"processes x{workers}", OperationService(executor=executor), operations)
+
+
+if __name__ == "__main__":
+    main()
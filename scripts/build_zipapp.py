@@ -0,0 +1,56 @@
+"""
+Builds a self-contained, startup-optimized zipapp of the CLI with precompiled bytecode.
+
+Run from the project root:
+
+    python -m scripts.build_zipapp
+
+Then run it with:
+
+    python dist/nubank.pyz < operations.txt
+"""
+import compileall
+import os
+import shutil
+import sys
+import tempfile
+import zipapp
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_TARGET = os.path.join(PROJECT_ROOT, "dist", "nubank.pyz")
+
+
+def build(target: str = DEFAULT_TARGET, optimize: int = 2) -> str:
+    """
+    Copies the application package, compiles it and stores only the bytecode in a zipapp.
+
+    The .pyc files use the legacy layout (next to the source instead of __pycache__), which is the
+    only one zipimport loads, and the sources are left out, so nothing is compiled at startup.
+
+    Args:
+        target (str): Path of the generated .pyz file.
+        optimize (int): Optimization level of the bytecode (2 also strips docstrings).
+
+    Returns:
+        str: The path of the generated .pyz file.
+    """
+    with tempfile.TemporaryDirectory() as staging:
+        shutil.copytree(os.path.join(PROJECT_ROOT, "src", "main"), os.path.join(staging, "src", "main"),
+                        ignore=shutil.ignore_patterns("__pycache__", "*.pyc"))
+        shutil.copy(os.path.join(PROJECT_ROOT, "src", "__init__.py"), os.path.join(staging, "src"))
+        if not compileall.compile_dir(staging, quiet=1, legacy=True, optimize=optimize):
+            raise RuntimeError("Error compiling the application")
+        for directory, _, files in os.walk(staging):
+            for file in files:
+                if file.endswith(".py"):
+                    os.remove(os.path.join(directory, file))
+        with open(os.path.join(staging, "__main__.py"), "w") as main_file:
+            main_file.write("from src.main.main import main\nmain()\n")
+
+        os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+        zipapp.create_archive(staging, target, interpreter=sys.executable)
+    return target
+
+
+if __name__ == "__main__":
+    print(build(*sys.argv[1:2]))
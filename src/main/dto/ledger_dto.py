@@ -0,0 +1,33 @@
+class LedgerDto:
+    """
+    Data Transfer Object representing the ledger state after processing a list of operations.
+    """
+    __slots__ = ("weighted_avg", "total_qty", "accumulated_loss")
+
+    def __init__(self, weighted_avg: float, total_qty: int, accumulated_loss: float) -> None:
+        self.weighted_avg = weighted_avg
+        self.total_qty = total_qty
+        self.accumulated_loss = accumulated_loss
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.weighted_avg, self.total_qty, self.accumulated_loss) == \
+            (other.weighted_avg, other.total_qty, other.accumulated_loss)
+
+    def __repr__(self) -> str:
+        return (f"LedgerDto(weighted_avg={self.weighted_avg!r}, total_qty={self.total_qty!r}, "
+                f"accumulated_loss={self.accumulated_loss!r})")
+
+    def to_dict(self) -> dict:
+        """
+        Convert the LedgerDto to a dictionary.
+
+        Returns:
+            dict: Dictionary with the ledger values.
+        """
+        return {
+            "weighted_avg": self.weighted_avg,
+            "total_qty": self.total_qty,
+            "accumulated_loss": self.accumulated_loss,
+        }
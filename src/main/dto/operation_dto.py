@@ -1,15 +1,13 @@
-from src.main.enums.operation_type_enum import OperationTypeEnum
-from dataclasses import dataclass, field
+from src.main.enums.operation_type_enum import OperationTypeEnum, OPERATION_TYPES_BY_VALUE
 
 
-@dataclass
 class OperationDto:
     """
     Data Transfer Object representing a stock market operation (buy or sell).
+    Plain slotted class instead of a dataclass, so importing it does not pull in dataclasses/inspect.
+    Instances are read-only, as OperationInterner shares them between operations.
     """
-    operation: OperationTypeEnum = field()
-    unit_cost: float = field()
-    quantity: int = field()
+    __slots__ = ("operation", "unit_cost", "quantity")
 
     def __init__(self, operation: str, unit_cost: float, quantity: int) -> None:
         """
@@ -21,12 +19,27 @@ class OperationDto:
             quantity (int): The quantity of assets.
         """
         # Accept both string and enum for flexibility
-        if isinstance(operation, OperationTypeEnum):
-            self.operation = operation
-        else:
-            self.operation = OperationTypeEnum(operation)
-        self.unit_cost = unit_cost
-        self.quantity = quantity
+        if not isinstance(operation, OperationTypeEnum):
+            operation = OPERATION_TYPES_BY_VALUE.get(operation) or OperationTypeEnum(operation)
+        object.__setattr__(self, "operation", operation)
+        object.__setattr__(self, "unit_cost", unit_cost)
+        object.__setattr__(self, "quantity", quantity)
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError(f"OperationDto is read-only, cannot set {name!r}")
+
+    def __delattr__(self, name) -> None:
+        raise AttributeError(f"OperationDto is read-only, cannot delete {name!r}")
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.operation, self.unit_cost, self.quantity) == \
+            (other.operation, other.unit_cost, other.quantity)
+
+    def __repr__(self) -> str:
+        return (f"OperationDto(operation={self.operation!r}, unit_cost={self.unit_cost!r}, "
+                f"quantity={self.quantity!r})")
 
     @staticmethod
     def from_dict(data: dict) -> "OperationDto":
@@ -1,12 +1,19 @@
-from dataclasses import dataclass
-
-
-@dataclass
 class OperationTaxDto:
     """
     Data Transfer Object representing the tax result for an operation.
     """
-    tax: float
+    __slots__ = ("tax",)
+
+    def __init__(self, tax: float) -> None:
+        self.tax = tax
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.tax == other.tax
+
+    def __repr__(self) -> str:
+        return f"OperationTaxDto(tax={self.tax!r})"
 
     def to_dict(self) -> dict:
         """
@@ -7,3 +7,7 @@ class OperationTypeEnum(Enum):
     """
     BUY = "buy"
     SELL = "sell"
+
+
+# Plain dict lookup, much cheaper than OperationTypeEnum(value) on the parsing hot path
+OPERATION_TYPES_BY_VALUE = {member.value: member for member in OperationTypeEnum}
@@ -1,27 +1,242 @@
 """
 Main application entry point.
+Optional features (argparse, sqlite3, compression modules) are imported lazily, keeping the
+startup of the plain stdin to stdout path short.
 """
+import os
 import sys
+from types import SimpleNamespace
 from src.main.services.input_service import InputService
+from src.main.services.operation_service import OperationService
 from src.main.exceptions.exception import OperationProcessingError
+from src.main.utils.stream_util import StreamUtil, COMPRESSION_MODULES
+from src.main.utils.operation_util import OperationInterner, DEFAULT_INTERNER_SIZE
 
+DEFAULT_OPTIONS = {
+    "input": None,
+    "output": None,
+    "compress": None,
+    "sqlite": None,
+    "stream": False,
+    "follow": False,
+    "offset_file": None,
+    "intern": None,
+    "threads": None,
+    "profile": None,
+    "profile_memory": False,
+    "merge": None,
+}
 
-def main() -> None:
+PROFILE_ENV = "NUBANK_PROFILE"
+PROFILE_MEMORY_ENV = "NUBANK_PROFILE_MEMORY"
+
+
+def parse_args(argv=None) -> SimpleNamespace:
+    """
+    Parses the command line options.
+
+    Args:
+        argv (list[str] or None): Command line arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        The parsed options (argparse.Namespace, or the defaults when there are no arguments).
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv:
+        return SimpleNamespace(**DEFAULT_OPTIONS)
+
+    import argparse
+    parser = argparse.ArgumentParser(
+        description="Calculates the taxes of stock market operations.")
+    parser.set_defaults(**DEFAULT_OPTIONS)
+    parser.add_argument("--input", "-i",
+                        help="Input file (plain, gzip, bz2 or xz). Defaults to stdin.")
+    parser.add_argument("--output", "-o",
+                        help="Output file. Defaults to stdout.")
+    parser.add_argument("--compress", choices=sorted(COMPRESSION_MODULES),
+                        help="Compress the output with the given format.")
+    parser.add_argument("--sqlite",
+                        help="Also stores the taxes and final ledger states in this SQLite database.")
+    parser.add_argument("--stream", action="store_true",
+                        help="Parses each line incrementally and writes each result as soon as it is "
+                             "produced, with constant memory regardless of the line size.")
+    parser.add_argument("--follow", "-f", action="store_true",
+                        help="Keeps polling the input file and processes only the newly appended lines, "
+                             "appending one result line per input line to the output file.")
+    parser.add_argument("--offset-file",
+                        help="File storing the read offset of --follow. Defaults to the output file + .offset.")
+    parser.add_argument("--intern", type=int, nargs="?", const=DEFAULT_INTERNER_SIZE, metavar="SIZE",
+                        help="Shares the instances of repeated operations, caching up to SIZE distinct "
+                             f"operations (default {DEFAULT_INTERNER_SIZE}), and prints the cache "
+                             "statistics to stderr.")
+    parser.add_argument("--threads", type=int, metavar="N",
+                        help="Computes the lines with a pool of N threads. Mostly useful on free-threaded "
+                             "(no-GIL) Python builds.")
+    parser.add_argument("--profile", metavar="PREFIX",
+                        help="Runs under cProfile, writing PREFIX.pstats and PREFIX.collapsed (flamegraph "
+                             f"collapsed stacks). Can also be enabled with the {PROFILE_ENV} environment variable.")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="With --profile, also writes tracemalloc snapshots per stage to PREFIX.memory.txt "
+                             f"(or set {PROFILE_MEMORY_ENV}=1).")
+    parser.add_argument("--merge", nargs="+", metavar="FILE",
+                        help="Merges files with one tagged operation per line ({\"timestamp\": ..., "
+                             "\"account\": ..., \"operation\": ...}), each sorted by timestamp, and writes "
+                             "one result per operation, calculated against the ledger of its account.")
+    args = parser.parse_args(argv)
+    if args.stream and args.sqlite:
+        parser.error("--stream cannot be combined with --sqlite")
+    if args.follow and not (args.input and args.output):
+        parser.error("--follow requires --input and --output")
+    if args.follow and (args.compress or args.sqlite or args.stream):
+        parser.error("--follow cannot be combined with --compress, --sqlite or --stream")
+    if args.intern is not None and args.intern < 1:
+        parser.error("--intern must be at least 1")
+    if args.threads is not None and args.threads < 1:
+        parser.error("--threads must be at least 1")
+    if args.threads and (args.stream or args.follow):
+        parser.error("--threads cannot be combined with --stream or --follow")
+    if args.merge and (args.input or args.stream or args.follow or args.sqlite or args.threads or args.intern):
+        parser.error("--merge cannot be combined with --input, --stream, --follow, --sqlite, --threads or --intern")
+    return args
+
+
+def main(argv=None) -> None:
     """
     Reads lists (one per line) of stock market operations in JSON format via stdin,
     processes them, and outputs the tax results.
+    Compressed input (gzip, bz2 or xz) is detected and decompressed automatically.
 
     Example input:
     [{"operation":"buy", "unit-cost":10.00, "quantity": 10000},{"operation":"sell", "unit-cost":20.00, "quantity": 5000}]
     [{"operation":"buy", "unit-cost":20.00, "quantity": 10000}, {"operation":"sell", "unit-cost":10.00, "quantity": 5000}]
     """
-    lines = sys.stdin.readlines()
+    args = parse_args(argv)
+    profile = args.profile or os.environ.get(PROFILE_ENV)
+    if not profile:
+        run(args)
+        return
+
+    from src.main.utils.profile_util import Profiler
+    profiler = Profiler(profile, args.profile_memory or os.environ.get(PROFILE_MEMORY_ENV) == "1")
+    profiler.start()
+    try:
+        run(args, profiler)
+    finally:
+        paths = profiler.stop()
+        sys.stderr.write(f"Profile written to {', '.join(paths)}\n")
+
+
+def run(args, profiler=None) -> None:
+    """
+    Runs the pipeline with the parsed options.
+
+    Args:
+        args: The parsed options (see parse_args).
+        profiler (Profiler or None): Profiler notified at the end of each stage.
+    """
+    if args.merge:
+        run_merge(args, profiler)
+        return
+
+    interner = OperationInterner(args.intern) if args.intern else None
+    if args.follow:
+        from src.main.services.follow_service import FollowService
+        try:
+            FollowService(args.input, args.output, args.offset_file,
+                          InputService(interner=interner)).follow()
+        finally:
+            print_interner_stats(interner)
+        return
+
+    executor = None
+    if args.threads:
+        from concurrent.futures import ThreadPoolExecutor
+        executor = ThreadPoolExecutor(args.threads)
+    input_file = open(args.input, "rb") if args.input else sys.stdin.buffer
+    output_file = open(args.output, "wb") if args.output else sys.stdout.buffer
+    input_stream = None
+    try:
+        input_stream = StreamUtil.open_input(input_file)
+        input_service = InputService(OperationService(executor=executor), interner=interner)
+        if args.stream:
+            output = StreamUtil.open_output(output_file, args.compress)
+            try:
+                input_service.process_stream(input_stream, output)
+            finally:
+                # Flushes the results written so far, even when the input turns out to be invalid
+                output.close()
+            if profiler is not None:
+                profiler.stage("stream")
+            return
+        lines = input_stream.readlines()
+        if profiler is not None:
+            profiler.stage("read")
+        if args.sqlite:
+            from src.main.services.sqlite_sink_service import SqliteSinkService
+            with SqliteSinkService(args.sqlite) as sink:
+                results = input_service.process_input(lines, sink)
+        else:
+            results = input_service.process_input(lines)
+        if profiler is not None:
+            profiler.stage("process")
+        output = StreamUtil.open_output(output_file, args.compress)
+        output.write(str(results))
+        output.close()
+        if profiler is not None:
+            profiler.stage("write")
+    except Exception as e:
+        raise OperationProcessingError(str(e))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        print_interner_stats(interner)
+        if args.input:
+            input_file.close()
+        elif input_stream is not None:
+            # Detached, otherwise garbage-collecting the text stream would close sys.stdin.buffer
+            input_stream.detach()
+        if args.output:
+            output_file.close()
+
+
+def print_interner_stats(interner) -> None:
+    """
+    Prints the statistics of the --intern cache to stderr.
+
+    Args:
+        interner (OperationInterner or None): The cache. Nothing is printed when it is None.
+    """
+    if interner is not None:
+        stats = interner.stats()
+        sys.stderr.write(f"Interned operations: {stats['size']}, hits: {stats['hits']}, "
+                         f"misses: {stats['misses']}, hit rate: {stats['hit_rate']:.1%}\n")
+
+
+def run_merge(args, profiler=None) -> None:
+    """
+    Runs the k-way merge of the --merge files.
+
+    Args:
+        args: The parsed options (see parse_args).
+        profiler (Profiler or None): Profiler notified at the end of the merge.
+    """
+    from src.main.services.merge_service import MergeService
+    output_file = open(args.output, "wb") if args.output else sys.stdout.buffer
     try:
-        input_service = InputService()
-        results = input_service.process_input(lines)
-        sys.stdout.write(str(results))
+        output = StreamUtil.open_output(output_file, args.compress)
+        try:
+            MergeService().process_files(args.merge, output)
+        finally:
+            # Flushes the results written so far, even when a file turns out to be invalid
+            output.close()
+        if profiler is not None:
+            profiler.stage("merge")
     except Exception as e:
         raise OperationProcessingError(str(e))
+    finally:
+        if args.output:
+            output_file.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,165 @@
+"""
+Follow service for application. It tails an input file that is continuously appended to,
+processing only the new complete lines and persisting the read offset between restarts.
+The output size is persisted with the offset, so results written after the last saved offset
+(e.g. before a crash) are truncated on restart instead of being written twice.
+"""
+import os
+import sys
+import time
+from src.main.services.input_service import InputService
+from src.main.exceptions.exception import OperationProcessingError
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+MIN_POLL_INTERVAL = 0.05
+MAX_POLL_INTERVAL = 0.5
+OFFSET_FILE_SUFFIX = ".offset"
+
+
+class FollowService:
+    """
+    Service that incrementally processes the lines appended to an input file.
+    Each processed line produces one line in the output file with its tax results.
+    Allows dependency injection for easier testing and flexibility.
+    """
+
+    def __init__(self, input_path: str, output_path: str, offset_path: str = None, input_service=None,
+                 min_poll_interval: float = MIN_POLL_INTERVAL, max_poll_interval: float = MAX_POLL_INTERVAL,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """
+        Args:
+            input_path (str): File being appended to, each line a JSON array of operations.
+            output_path (str): File the results are appended to.
+            offset_path (str): File storing the read offset. Defaults to output_path + ".offset".
+            input_service: Instance of InputService. Defaults to InputService().
+            min_poll_interval (float): Seconds between polls while lines keep arriving.
+            max_poll_interval (float): Seconds between polls once the file is idle.
+            chunk_size (int): Maximum number of bytes read from the input at a time.
+        """
+        self.input_path = input_path
+        self.output_path = output_path
+        self.offset_path = offset_path or output_path + OFFSET_FILE_SUFFIX
+        self.input_service = input_service or InputService()
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.chunk_size = chunk_size
+        self.offset, self.output_size = self.__load_offset()
+        self.__truncate_output()
+
+    def follow(self, max_polls: int = None) -> None:
+        """
+        Polls the input file, processing new lines as they are appended, until interrupted.
+        The poll interval doubles while the file is idle, up to max_poll_interval, and goes back
+        to min_poll_interval as soon as new lines arrive.
+
+        Args:
+            max_polls (int or None): Stops after this number of polls. Defaults to polling forever.
+        """
+        interval = self.min_poll_interval
+        polls = 0
+        try:
+            while max_polls is None or polls < max_polls:
+                polls += 1
+                if self.poll():
+                    interval = self.min_poll_interval
+                else:
+                    interval = min(interval * 2, self.max_poll_interval)
+                if max_polls is None or polls < max_polls:
+                    time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+
+    def poll(self) -> int:
+        """
+        Processes the complete lines appended since the last poll, reading at most chunk_size bytes
+        at a time and persisting the offset after each chunk.
+        Each line is processed on its own: an invalid line is reported on stderr and skipped, so it
+        never blocks the lines after it.
+
+        Returns:
+            int: The number of lines read.
+        """
+        try:
+            size = os.stat(self.input_path).st_size
+        except FileNotFoundError:
+            return 0
+        if size < self.offset:
+            # The input was truncated or replaced, so it is read again from the beginning
+            self.offset = 0
+        if size == self.offset:
+            return 0
+
+        lines_read = 0
+        pending = b""
+        with open(self.input_path, "rb") as input_file:
+            input_file.seek(self.offset)
+            while True:
+                chunk = input_file.read(self.chunk_size)
+                if not chunk:
+                    break
+                # A line longer than a chunk is kept until its end is read
+                data = pending + chunk
+                end = data.rfind(b"\n") + 1
+                if not end:
+                    pending = data
+                    continue
+                pending = data[end:]
+                lines_read += self.__process_lines(data[:end], self.offset)
+                self.offset += end
+                self.output_size = os.path.getsize(self.output_path)
+                self.__save_offset()
+        return lines_read
+
+    def __process_lines(self, data: bytes, offset: int) -> int:
+        """
+        Processes each complete line of data, appending one result line per valid input line.
+
+        Returns:
+            int: The number of lines read.
+        """
+        # data ends with a newline; splitting on it only (not on \r) keeps the byte offsets exact
+        lines = data[:-1].split(b"\n")
+        with open(self.output_path, "a", encoding="utf-8") as output_file:
+            for line in lines:
+                try:
+                    results = self.input_service.process_input([line.decode("utf-8")])
+                except (OperationProcessingError, UnicodeDecodeError) as e:
+                    sys.stderr.write(f"Skipping invalid line at byte {offset} of {self.input_path}: {e}\n")
+                    results = []
+                for result in results:
+                    output_file.write(str(result) + "\n")
+                offset += len(line) + 1
+        return len(lines)
+
+    def __load_offset(self) -> tuple:
+        """
+        Returns the saved input offset and output size (None when unknown).
+        """
+        try:
+            with open(self.offset_path, encoding="utf-8") as offset_file:
+                values = offset_file.read().split()
+        except FileNotFoundError:
+            return 0, None
+        try:
+            offset = int(values[0]) if values else 0
+            output_size = int(values[1]) if len(values) > 1 else None
+        except ValueError:
+            raise OperationProcessingError(f"Invalid offset file: {self.offset_path}")
+        return offset, output_size
+
+    def __truncate_output(self) -> None:
+        # Results appended after the offset was last saved belong to lines that are read again
+        if self.output_size is None:
+            return
+        try:
+            if os.path.getsize(self.output_path) > self.output_size:
+                os.truncate(self.output_path, self.output_size)
+        except FileNotFoundError:
+            pass
+
+    def __save_offset(self) -> None:
+        # Written to a temporary file and renamed, so a crash never leaves a partial offset
+        temporary_path = self.offset_path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as offset_file:
+            offset_file.write(f"{self.offset}\n{self.output_size}\n")
+        os.replace(temporary_path, self.offset_path)
@@ -1,4 +1,3 @@
-from typing import List
 from src.main.services.operation_service import OperationService
 from src.main.utils.operation_util import OperationUtil
 from src.main.dto.operation_dto import OperationDto
@@ -10,25 +9,52 @@ class InputService:
     Allows dependency injection for easier testing and flexibility.
     """
 
-    def __init__(self, operation_service=None, operation_util=None):
+    def __init__(self, operation_service=None, operation_util=None, interner=None):
         """
         Args:
             operation_service: Instance of OperationService. Defaults to OperationService().
             operation_util: Utility class for formatting operations. Defaults to OperationUtil.
+            interner: Optional OperationInterner sharing the instances of repeated operations.
         """
         self.operation_service = operation_service or OperationService()
         self.operation_util = operation_util or OperationUtil
+        self.interner = interner
 
-    def process_input(self, lines: List[str]) -> list[list[dict]]:
+    def process_input(self, lines: list[str], sink=None) -> list[list[dict]]:
         """
         Process input lines, format them as operations, and calculate taxes.
 
         Args:
-            lines (List[str]): Lines of input, each a JSON array of operations.
+            lines (list[str]): Lines of input, each a JSON array of operations.
+            sink: Optional result sink (e.g. SqliteSinkService) passed to the OperationService.
 
         Returns:
             list: List of lists of OperationTaxDto as dicts.
         """
         operations_list: list[list[OperationDto]
-                              ] = self.operation_util.format_operations_file(lines)
-        return self.operation_service.process_operations(operations_list)
+                              ] = self.operation_util.format_operations_file(
+                                  lines, interner=self.interner)
+        return self.operation_service.process_operations(operations_list, sink)
+
+    def process_stream(self, stream, output) -> None:
+        """
+        Process a text stream incrementally, writing each tax result to output as soon as it is
+        produced. Memory usage does not depend on the size of the lines.
+        The written text has the same format as str() of the process_input result.
+
+        Args:
+            stream: Text stream, each line a JSON array of operations.
+            output: Writable text stream receiving the results.
+        """
+        output.write("[")
+        for line_index, operations in enumerate(self.operation_util.stream_operations(
+                stream, interner=self.interner)):
+            if line_index:
+                output.write(", ")
+            output.write("[")
+            for operation_index, tax in enumerate(self.operation_service.iter_taxes(operations)):
+                if operation_index:
+                    output.write(", ")
+                output.write(str(tax))
+            output.write("]")
+        output.write("]")
@@ -0,0 +1,94 @@
+"""
+Merge service for application. It fans in several input files, each sorted by timestamp and
+tagged with accounts, merging them by timestamp and calculating the taxes of each account.
+"""
+import heapq
+from operator import itemgetter
+from src.main.config.tax_config import ZERO
+from src.main.dto.ledger_dto import LedgerDto
+from src.main.services.tax_service import TaxService
+from src.main.utils.operation_util import OperationUtil
+from src.main.utils.stream_util import StreamUtil
+from src.main.exceptions.exception import OperationProcessingError
+
+
+class MergeService:
+    """
+    Service for the k-way merge of tagged operation files.
+    Only one pending operation per file and one ledger per account are kept in memory, so the
+    files never have to be concatenated, sorted or grouped by account beforehand.
+    Allows dependency injection for easier testing and flexibility.
+    """
+
+    def __init__(self, tax_service=None, operation_util=None) -> None:
+        """
+        Args:
+            tax_service: Instance of a tax calculation service. Defaults to TaxService().
+            operation_util: Utility class for parsing operations. Defaults to OperationUtil.
+        """
+        self.tax_service = tax_service or TaxService()
+        self.operation_util = operation_util or OperationUtil
+
+    def merge_streams(self, streams: list[tuple]):
+        """
+        Merges the tagged operations of several streams by timestamp. Operations with the same
+        timestamp keep the order of the streams.
+
+        Args:
+            streams (list[tuple]): (source name, text stream) pairs, each stream with one tagged
+                operation per line, sorted by timestamp.
+
+        Returns:
+            Iterator[tuple]: (timestamp, account, OperationDto) in timestamp order.
+        """
+        return heapq.merge(*(self.operation_util.stream_tagged_operations(stream, source)
+                             for source, stream in streams), key=itemgetter(0))
+
+    def process_streams(self, streams: list[tuple], output) -> dict:
+        """
+        Calculates the tax of each merged operation against the ledger of its account, writing
+        one result per operation to output as soon as it is calculated.
+
+        Args:
+            streams (list[tuple]): (source name, text stream) pairs (see merge_streams).
+            output: Writable text stream receiving one result dict per line.
+
+        Returns:
+            dict: Final LedgerDto of each account.
+        """
+        ledgers = {}
+        try:
+            for timestamp, account, operation in self.merge_streams(streams):
+                ledger = ledgers.get(account)
+                if ledger is None:
+                    ledger = ledgers[account] = LedgerDto(ZERO, 0, ZERO)
+                tax = self.tax_service.calculate_tax(operation, ledger)
+                output.write(str({"timestamp": timestamp, "account": account, **tax}) + "\n")
+        except OperationProcessingError:
+            raise
+        except Exception as e:
+            raise OperationProcessingError(
+                f"Error processing operation: {str(e)}")
+        return ledgers
+
+    def process_files(self, paths: list[str], output) -> dict:
+        """
+        Opens the files (plain, gzip, bz2 or xz) and processes them with process_streams.
+
+        Args:
+            paths (list[str]): Paths of the files, each sorted by timestamp.
+            output: Writable text stream receiving one result dict per line.
+
+        Returns:
+            dict: Final LedgerDto of each account.
+        """
+        files = []
+        try:
+            streams = []
+            for path in paths:
+                files.append(open(path, "rb"))
+                streams.append((path, StreamUtil.open_input(files[-1])))
+            return self.process_streams(streams, output)
+        finally:
+            for file in files:
+                file.close()
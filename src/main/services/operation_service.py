@@ -12,32 +12,90 @@ class OperationService:
     """
     Service for processing lists of operations and calculating taxes.
     Allows dependency injection for easier testing and flexibility.
+
+    Lines are independent: TaxService only holds its immutable configuration, TaxUtil is stateless
+    and the ledger state of each line is local to its calculation. So lines can be computed
+    concurrently by an executor sharing a single TaxService, e.g. a ThreadPoolExecutor, which
+    scales on free-threaded CPython builds without the pickling and start-up costs of processes.
     """
 
-    def __init__(self, tax_service=None) -> None:
+    def __init__(self, tax_service=None, executor=None) -> None:
         """
         Args:
             tax_service: Instance of a tax calculation service. Defaults to TaxService().
+            executor: Optional concurrent.futures.Executor computing the lines concurrently.
+                Defaults to computing them sequentially in the calling thread.
         """
         self.tax_service = tax_service or TaxService()
+        self.executor = executor
 
-    def process_operations(self, operations: list[list[OperationDto]]) -> list[list[dict]]:
+    def process_operations(self, operations: list[list[OperationDto]], sink=None) -> list[list[dict]]:
         """
         Gets a list of lists of OperationDto and returns a list of tax results for each operation.
 
         Args:
             operations (list[list[OperationDto]]): List of lists of OperationDto.
+            sink: Optional result sink (e.g. SqliteSinkService) receiving the taxes and the final
+                ledger state of each line.
 
         Returns:
             list: List of lists of OperationTaxDto as dicts.
         """
+        if self.executor is not None:
+            return self.__process_operations_concurrently(operations, sink)
+        try:
+            tax_results = []
+            for line_index, operation_dto_list in enumerate(operations):
+                if sink is None:
+                    operation_taxes = self.tax_service.calculate_taxes(
+                        operation_dto_list)
+                else:
+                    operation_taxes, ledger, executed_quantities = self.tax_service.calculate_taxes_and_ledger(
+                        operation_dto_list)
+                    sink.write_line(line_index, operation_dto_list,
+                                    operation_taxes, ledger, executed_quantities)
+                tax_results.append(operation_taxes)
+            return tax_results
+        except Exception as e:
+            raise OperationProcessingError(
+                f"Error processing operation: {str(e)}")
+
+    def __process_operations_concurrently(self, operations: list[list[OperationDto]], sink) -> list[list[dict]]:
+        """
+        Computes the lines with the executor. The results are consumed in the input order, so the
+        sink, which is not thread-safe, is only called from the calling thread.
+        """
         try:
+            if sink is None:
+                return list(self.executor.map(self.tax_service.calculate_taxes, operations))
+
             tax_results = []
-            for operation_dto_list in operations:
-                operation_taxes = self.tax_service.calculate_taxes(
-                    operation_dto_list)
+            results = self.executor.map(
+                self.tax_service.calculate_taxes_and_ledger, operations)
+            for line_index, (operation_dto_list, (operation_taxes, ledger, executed_quantities)) in \
+                    enumerate(zip(operations, results)):
+                sink.write_line(line_index, operation_dto_list,
+                                operation_taxes, ledger, executed_quantities)
                 tax_results.append(operation_taxes)
             return tax_results
         except Exception as e:
             raise OperationProcessingError(
                 f"Error processing operation: {str(e)}")
+
+    def iter_taxes(self, operations):
+        """
+        Lazily calculates the tax results of a single line of operations.
+
+        Args:
+            operations (Iterable[OperationDto]): Operations of one line, e.g. streamed from the input.
+
+        Yields:
+            dict: The tax result (OperationTaxDto as dict) of each operation.
+        """
+        try:
+            yield from self.tax_service.iter_taxes(operations)
+        except OperationProcessingError:
+            raise
+        except Exception as e:
+            raise OperationProcessingError(
+                f"Error processing operation: {str(e)}")
@@ -0,0 +1,196 @@
+"""
+SQLite sink service for application. It stores the tax results of each operation and the final
+ledger state of each input line in a local SQLite database, so historical runs can be queried
+without reprocessing the input.
+"""
+import sqlite3
+import time
+from src.main.dto.operation_dto import OperationDto
+from src.main.dto.ledger_dto import LedgerDto
+from src.main.enums.operation_type_enum import OperationTypeEnum
+from src.main.exceptions.exception import OperationProcessingError
+
+DEFAULT_BATCH_SIZE = 10000
+DEFAULT_TRANSACTION_SIZE = 500000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at REAL NOT NULL,
+    completed_at REAL
+);
+CREATE TABLE IF NOT EXISTS operation_taxes (
+    run_id INTEGER NOT NULL,
+    line_index INTEGER NOT NULL,
+    operation_index INTEGER NOT NULL,
+    operation TEXT NOT NULL,
+    unit_cost REAL NOT NULL,
+    quantity INTEGER NOT NULL,
+    executed_quantity INTEGER NOT NULL,
+    total_value REAL NOT NULL,
+    tax REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS ledgers (
+    run_id INTEGER NOT NULL,
+    line_index INTEGER NOT NULL,
+    weighted_avg REAL NOT NULL,
+    total_qty INTEGER NOT NULL,
+    accumulated_loss REAL NOT NULL
+);
+"""
+
+# Indexes are created when the first run is closed, so its inserts do not have to maintain them.
+# Later runs insert into the existing indexes.
+INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_operation_taxes_run_line ON operation_taxes (run_id, line_index);
+CREATE INDEX IF NOT EXISTS idx_operation_taxes_taxed_sells ON operation_taxes (operation, total_value)
+    WHERE tax > 0;
+CREATE INDEX IF NOT EXISTS idx_ledgers_run_line ON ledgers (run_id, line_index);
+"""
+
+INSERT_OPERATION_TAX = "INSERT INTO operation_taxes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+INSERT_LEDGER = "INSERT INTO ledgers VALUES (?, ?, ?, ?, ?)"
+
+
+class SqliteSinkService:
+    """
+    Service that writes tax results and ledger states to a SQLite database.
+    Rows are buffered and written with executemany inside large transactions.
+    """
+
+    def __init__(self, database_path: str, batch_size: int = DEFAULT_BATCH_SIZE,
+                 transaction_size: int = DEFAULT_TRANSACTION_SIZE) -> None:
+        """
+        Args:
+            database_path (str): Path of the SQLite database file. It is created if it does not exist.
+            batch_size (int): Number of buffered rows written by each executemany call.
+            transaction_size (int): Number of rows written before the transaction is committed.
+        """
+        self.batch_size = batch_size
+        self.transaction_size = transaction_size
+        self.connection = sqlite3.connect(database_path, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        self.connection.execute("BEGIN")
+        self.run_id = self.connection.execute(
+            "INSERT INTO runs (created_at) VALUES (?)", (time.time(),)).lastrowid
+        self.operation_rows = []
+        self.ledger_rows = []
+        self.rows_in_transaction = 0
+        self.committed = False
+
+    def __enter__(self) -> "SqliteSinkService":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.rollback()
+
+    def write_line(self, line_index: int, operations: list[OperationDto], taxes: list[dict],
+                   ledger: LedgerDto, executed_quantities: list[int]) -> None:
+        """
+        Buffers the tax results and the final ledger state of one input line.
+
+        Args:
+            line_index (int): Index of the line in the input.
+            operations (list[OperationDto]): Operations of the line.
+            taxes (list[dict]): Tax results (OperationTaxDto as dicts) of the line.
+            ledger (LedgerDto): Ledger state after the last operation of the line.
+            executed_quantities (list[int]): Quantity actually bought or sold by each operation,
+                on which the total value (and so the tax exemption threshold) is based.
+        """
+        run_id = self.run_id
+        self.operation_rows.extend(
+            (run_id, line_index, operation_index, op.operation.value, op.unit_cost, op.quantity,
+             executed_quantity, op.unit_cost * executed_quantity, tax["tax"])
+            for operation_index, (op, tax, executed_quantity) in enumerate(zip(operations, taxes, executed_quantities)))
+        self.ledger_rows.append(
+            (run_id, line_index, ledger.weighted_avg, ledger.total_qty, ledger.accumulated_loss))
+        if len(self.operation_rows) + len(self.ledger_rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the buffered rows, committing the transaction when it reaches transaction_size rows.
+        """
+        try:
+            self.connection.executemany(INSERT_OPERATION_TAX, self.operation_rows)
+            self.connection.executemany(INSERT_LEDGER, self.ledger_rows)
+        except sqlite3.Error as e:
+            raise OperationProcessingError(f"Error writing results: {str(e)}")
+        self.rows_in_transaction += len(self.operation_rows) + len(self.ledger_rows)
+        self.operation_rows = []
+        self.ledger_rows = []
+        if self.rows_in_transaction >= self.transaction_size:
+            self.connection.execute("COMMIT")
+            self.connection.execute("BEGIN")
+            self.rows_in_transaction = 0
+            self.committed = True
+
+    def close(self) -> None:
+        """
+        Writes the remaining rows, commits, builds the indexes and closes the database.
+        """
+        if self.connection is None:
+            return
+        self.flush()
+        # Rows of large runs are committed in several transactions, so a run only counts once it
+        # is marked as completed, in the same transaction as its last rows
+        self.connection.execute("UPDATE runs SET completed_at = ? WHERE id = ?", (time.time(), self.run_id))
+        self.connection.execute("COMMIT")
+        self.connection.executescript(INDEXES)
+        self.connection.close()
+        self.connection = None
+
+    def rollback(self) -> None:
+        """
+        Discards the current run, including its runs row, and closes the database.
+        Used instead of close() when the run fails, so a failed run is never stored.
+        """
+        if self.connection is None:
+            return
+        self.operation_rows = []
+        self.ledger_rows = []
+        self.connection.execute("ROLLBACK")
+        if self.committed:
+            # Rows of large runs may already have been committed in earlier transactions
+            self.connection.execute("BEGIN")
+            self.connection.execute("DELETE FROM operation_taxes WHERE run_id = ?", (self.run_id,))
+            self.connection.execute("DELETE FROM ledgers WHERE run_id = ?", (self.run_id,))
+            self.connection.execute("DELETE FROM runs WHERE id = ?", (self.run_id,))
+            self.connection.execute("COMMIT")
+        self.connection.close()
+        self.connection = None
+
+    @staticmethod
+    def find_taxed_sells(database_path: str, min_total_value: float = 0.0, run_id: int = None) -> list[dict]:
+        """
+        Returns the sell operations that paid tax and whose total value is above min_total_value.
+        Runs that did not complete (e.g. the process was killed) are ignored.
+
+        Args:
+            database_path (str): Path of the SQLite database file.
+            min_total_value (float): Minimum total value (unit_cost * executed_quantity) of the sell.
+            run_id (int or None): Restricts the query to one run. Defaults to all runs.
+
+        Returns:
+            list: List of dicts with the stored columns of each operation.
+        """
+        query = ("SELECT * FROM operation_taxes "
+                 "WHERE operation = ? AND total_value > ? AND tax > 0 "
+                 "AND run_id IN (SELECT id FROM runs WHERE completed_at IS NOT NULL)")
+        params = [OperationTypeEnum.SELL.value, min_total_value]
+        if run_id is not None:
+            query += " AND run_id = ?"
+            params.append(run_id)
+        query += " ORDER BY run_id, line_index, operation_index"
+
+        connection = sqlite3.connect(database_path)
+        connection.row_factory = sqlite3.Row
+        try:
+            return [dict(row) for row in connection.execute(query, params)]
+        finally:
+            connection.close()
@@ -7,6 +7,7 @@ from src.main.enums.operation_type_enum import OperationTypeEnum
 from src.main.exceptions.exception import TaxCalculationError
 from src.main.dto.operation_dto import OperationDto
 from src.main.dto.operation_tax_dto import OperationTaxDto
+from src.main.dto.ledger_dto import LedgerDto
 from src.main.utils.tax_util import TaxUtil
 
 
@@ -34,27 +35,64 @@ class TaxService:
         Returns:
             list: List of tax values (OperationTaxDto) for each operation.
         """
+        return list(self.iter_taxes(operations))
+
+    def calculate_taxes_and_ledger(self, operations: list[OperationDto]) -> tuple[list[dict], LedgerDto, list[int]]:
+        """
+        Calculates the tax for each operation in the list and returns the final ledger state and
+        the quantity actually executed by each operation (a sell is capped by the held quantity).
+        Args:
+            operations (list[OperationDto]): List of operations to process.
+        Returns:
+            tuple: (list of tax values (OperationTaxDto) as dicts, final LedgerDto, list of executed quantities)
+        """
+        ledger = LedgerDto(ZERO, 0, ZERO)
         taxes = []
-        weighted_avg = ZERO
-        total_qty = 0
-        accumulated_loss = ZERO
+        executed_quantities = []
+        for op in operations:
+            total_qty = ledger.total_qty
+            taxes.append(self.calculate_tax(op, ledger))
+            executed_quantities.append(abs(ledger.total_qty - total_qty))
+        return taxes, ledger, executed_quantities
 
-        try:
-            for op in operations:
-                tax = ZERO
-                if op.operation == OperationTypeEnum.BUY:
-                    weighted_avg, total_qty = TaxUtil.process_buy_operation(
-                        weighted_avg, total_qty, op)
-                elif op.operation == OperationTypeEnum.SELL:
-                    tax, weighted_avg, total_qty, accumulated_loss = self.__process_sell_operation(
-                        op, weighted_avg, total_qty, accumulated_loss
-                    )
+    def iter_taxes(self, operations, ledger: LedgerDto = None):
+        """
+        Lazily calculates the tax for each operation, so operations can be consumed from a stream
+        and each tax emitted as soon as it is produced.
+        Args:
+            operations (Iterable[OperationDto]): Operations to process.
+            ledger (LedgerDto): Initial ledger state, updated in place after each operation.
+                Defaults to an empty ledger.
+        Yields:
+            dict: The tax value (OperationTaxDto) of each operation.
+        """
+        if ledger is None:
+            ledger = LedgerDto(ZERO, 0, ZERO)
+        for op in operations:
+            yield self.calculate_tax(op, ledger)
 
-                taxes.append(OperationTaxDto(tax).to_dict())
+    def calculate_tax(self, op: OperationDto, ledger: LedgerDto) -> dict:
+        """
+        Calculates the tax of a single operation, following the business rules.
+        Args:
+            op (OperationDto): The operation to process.
+            ledger (LedgerDto): Current ledger state, updated in place.
+        Returns:
+            dict: The tax value (OperationTaxDto) of the operation.
+        """
+        tax = ZERO
+        try:
+            if op.operation is OperationTypeEnum.BUY:
+                ledger.weighted_avg, ledger.total_qty = TaxUtil.process_buy_operation(
+                    ledger.weighted_avg, ledger.total_qty, op)
+            elif op.operation is OperationTypeEnum.SELL:
+                tax, ledger.weighted_avg, ledger.total_qty, ledger.accumulated_loss = self.__process_sell_operation(
+                    op, ledger.weighted_avg, ledger.total_qty, ledger.accumulated_loss
+                )
         except Exception as e:
             raise TaxCalculationError(str(e))
 
-        return taxes
+        return OperationTaxDto(tax).to_dict()
 
     def __process_sell_operation(self, op: OperationDto, weighted_avg, total_qty, accumulated_loss) -> tuple:
         """
@@ -3,9 +3,14 @@ from src.main.exceptions.exception import OperationProcessingError
 Operation util for application. It provides utility functions for processing operations.
 """
 
+import io
 import json
 from src.main.dto.operation_dto import OperationDto
 
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_INTERNER_SIZE = 100000
+WHITESPACE = " \t\r"
+
 
 class OperationUtil:
     """
@@ -13,16 +18,30 @@ class OperationUtil:
     """
 
     @staticmethod
-    def format_operations_file(lines) -> list[list[OperationDto]]:
+    def format_operations_file(lines, interner=None) -> list[list[OperationDto]]:
         """
         Format each received line (each must be a JSON list of operations).
 
         Args:
             lines (list[str]): Lines of input, each a JSON array of operations.
+            interner (OperationInterner or None): Shares the OperationDto instances of repeated
+                operations. Defaults to creating a new instance for each operation.
 
         Returns:
             list: List of lists of OperationDto objects.
         """
+        if interner is not None:
+            results = []
+            for line in lines:
+                reader = _OperationStreamReader(io.StringIO(line), max(len(line), 1), interner)
+                try:
+                    while reader.next_line():
+                        results.append(list(reader.operations()))
+                except OperationProcessingError:
+                    # Same message as without interner, as the reader only sees this one line
+                    raise OperationProcessingError(f"Invalid input: {line.strip()}")
+            return results
+
         results = []
         for line in lines:
             line = line.strip()
@@ -36,3 +55,262 @@ class OperationUtil:
                 raise OperationProcessingError(f"Invalid input: {line}")
 
         return results
+
+    @staticmethod
+    def stream_operations(stream, chunk_size: int = DEFAULT_CHUNK_SIZE, interner=None):
+        """
+        Incrementally parses a text stream of lines, each a JSON list of operations, reading it
+        in chunks so a single line never has to be held in memory.
+
+        Each yielded line is itself a generator of OperationDto and must be fully consumed
+        before advancing to the next line.
+
+        Args:
+            stream: Text stream with one JSON array of operations per line.
+            chunk_size (int): Number of characters read from the stream at a time.
+            interner (OperationInterner or None): Shares the OperationDto instances of repeated
+                operations. Defaults to creating a new instance for each operation.
+
+        Yields:
+            Iterator[OperationDto]: The operations of each non-empty line.
+        """
+        reader = _OperationStreamReader(stream, chunk_size, interner)
+        while reader.next_line():
+            yield reader.operations()
+
+    @staticmethod
+    def stream_tagged_operations(stream, source: str = "<stream>"):
+        """
+        Lazily parses a stream with one tagged operation per line, e.g.
+        {"timestamp": 1, "account": "a", "operation":"buy", "unit-cost":10.00, "quantity": 100},
+        checking that the lines are sorted by timestamp.
+
+        Args:
+            stream: Text stream with one JSON object per line.
+            source (str): Name of the stream used in error messages, e.g. its file path.
+
+        Yields:
+            tuple: (timestamp, account, OperationDto) of each non-empty line.
+        """
+        previous_timestamp = None
+        for line_number, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                data = json.loads(line)
+                timestamp = data["timestamp"]
+                account = data["account"]
+                operation = OperationDto.from_dict(data)
+                out_of_order = previous_timestamp is not None and timestamp < previous_timestamp
+            except Exception:
+                raise OperationProcessingError(f"Invalid input at {source}:{line_number}: {line}")
+            if out_of_order:
+                raise OperationProcessingError(
+                    f"Input not sorted by timestamp at {source}:{line_number}: {line}")
+            previous_timestamp = timestamp
+            yield timestamp, account, operation
+
+
+class OperationInterner:
+    """
+    Flyweight cache sharing OperationDto instances between repeated operations.
+
+    Operations are first looked up by the raw text of their JSON object, so a repeated object is
+    neither parsed nor converted to OperationTypeEnum again, and then by (type, cost, quantity), so
+    objects written differently but with the same values also share one instance. Both caches are
+    bounded; once full, new operations are still parsed but no longer cached.
+
+    The shared instances are safe to reuse because OperationDto is read-only.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_INTERNER_SIZE) -> None:
+        """
+        Args:
+            max_size (int): Maximum number of entries of each cache.
+        """
+        self.max_size = max_size
+        self.by_token = {}
+        self.by_value = {}
+        self.hits = 0
+        self.misses = 0
+
+    def decode(self, text: str, pos: int, decoder: json.JSONDecoder) -> tuple:
+        """
+        Decodes the JSON object starting at text[pos] into a (possibly shared) OperationDto.
+
+        Args:
+            text (str): Text containing the object.
+            pos (int): Index of the opening brace.
+            decoder (json.JSONDecoder): Decoder used on cache misses.
+
+        Returns:
+            tuple: (OperationDto, index right after the object)
+        """
+        # Operation objects are flat, so the first closing brace ends the token. When a string
+        # contains a brace, the token does not match the decoded object and is not cached.
+        close = text.find("}", pos) + 1
+        token = text[pos:close] if close else None
+        operation = self.by_token.get(token)
+        if operation is not None:
+            self.hits += 1
+            return operation, close
+
+        data, end = decoder.raw_decode(text, pos)
+        operation = self.intern(OperationDto.from_dict(data))
+        self.misses += 1
+        if end == close and len(self.by_token) < self.max_size:
+            self.by_token[token] = operation
+        return operation, end
+
+    def intern(self, operation: OperationDto) -> OperationDto:
+        """
+        Returns the shared instance with the same values as operation, caching it if there is none.
+
+        Args:
+            operation (OperationDto): The operation to intern.
+
+        Returns:
+            OperationDto: The shared instance.
+        """
+        # The types are part of the key, so 10 and 10.0 are not merged
+        key = (operation.operation, operation.unit_cost, operation.unit_cost.__class__,
+               operation.quantity, operation.quantity.__class__)
+        shared = self.by_value.get(key)
+        if shared is not None:
+            return shared
+        if len(self.by_value) < self.max_size:
+            self.by_value[key] = operation
+        return operation
+
+    def stats(self) -> dict:
+        """
+        Returns the cache statistics.
+
+        Returns:
+            dict: hits (operations found by their raw text), misses (operations parsed),
+                size (distinct shared instances) and hit_rate.
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.by_value),
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+class _OperationStreamReader:
+    """
+    Chunked reader holding the parsing position shared by the line and operation generators.
+    """
+
+    def __init__(self, stream, chunk_size: int, interner: OperationInterner = None) -> None:
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.interner = interner
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.line_number = 0
+
+    def next_line(self) -> bool:
+        """
+        Skips empty lines and positions the reader on the opening bracket of the next array.
+
+        Returns:
+            bool: False when the stream is exhausted.
+        """
+        while True:
+            char = self.__peek(WHITESPACE)
+            if char is None:
+                return False
+            if char == "\n":
+                self.pos += 1
+                self.line_number += 1
+                continue
+            if char != "[":
+                self.__fail()
+            self.pos += 1
+            return True
+
+    def operations(self):
+        """
+        Yields the operations of the current line, one element of the array at a time.
+        """
+        char = self.__peek(WHITESPACE)
+        if char == "]":
+            self.pos += 1
+        else:
+            while True:
+                yield self.__decode_operation()
+                char = self.__peek(WHITESPACE)
+                self.pos += 1
+                if char == "]":
+                    break
+                if char != ",":
+                    self.__fail()
+        char = self.__peek(WHITESPACE)
+        if char not in (None, "\n"):
+            self.__fail()
+
+    def __decode_operation(self) -> OperationDto:
+        """
+        Decodes the next JSON object into an OperationDto, reading more chunks while it is incomplete.
+        """
+        if self.__peek(WHITESPACE) != "{":
+            self.__fail()
+        while True:
+            try:
+                if self.interner is not None:
+                    operation, end = self.interner.decode(self.buffer, self.pos, self.decoder)
+                else:
+                    data, end = self.decoder.raw_decode(self.buffer, self.pos)
+                    operation = OperationDto.from_dict(data)
+                break
+            except json.JSONDecodeError:
+                if self.eof or "\n" in self.buffer[self.pos:] or not self.__read_chunk():
+                    self.__fail()
+            except Exception:
+                raise OperationProcessingError(
+                    f"Invalid operation at line {self.line_number + 1}: {self.buffer[self.pos:self.pos + 80]!r}")
+        # raw_decode accepts newlines inside the object, but an object must not span input lines
+        if self.buffer.find("\n", self.pos, end) != -1:
+            self.__fail()
+        self.pos = end
+        return operation
+
+    def __peek(self, skip: str):
+        """
+        Skips the given characters and returns the next one without consuming it (None at EOF).
+        """
+        while True:
+            buffer = self.buffer
+            pos = self.pos
+            length = len(buffer)
+            while pos < length and buffer[pos] in skip:
+                pos += 1
+            self.pos = pos
+            if pos < length:
+                return buffer[pos]
+            if not self.__read_chunk():
+                return None
+
+    def __read_chunk(self) -> bool:
+        """
+        Drops the consumed part of the buffer and appends the next chunk of the stream.
+        """
+        if self.eof:
+            return False
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def __fail(self) -> None:
+        raise OperationProcessingError(
+            f"Invalid input at line {self.line_number + 1}: {self.buffer[self.pos:self.pos + 80]!r}")
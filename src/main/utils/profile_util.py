@@ -0,0 +1,162 @@
+"""
+Profile util for application. It runs the pipeline under cProfile and writes a pstats file, a
+collapsed-stack file for flamegraph tools and, optionally, tracemalloc snapshots per stage.
+This module is only imported when profiling is enabled.
+"""
+import cProfile
+import os
+import pstats
+import tracemalloc
+
+PSTATS_SUFFIX = ".pstats"
+COLLAPSED_SUFFIX = ".collapsed"
+MEMORY_SUFFIX = ".memory.txt"
+MEMORY_TOP_STATS = 10
+
+
+class Profiler:
+    """
+    Profiles the code run between start() and stop().
+    """
+
+    def __init__(self, output_prefix: str, trace_memory: bool = False) -> None:
+        """
+        Args:
+            output_prefix (str): Prefix of the generated files (.pstats, .collapsed and .memory.txt).
+            trace_memory (bool): Also takes a tracemalloc snapshot at the end of each stage.
+        """
+        self.output_prefix = output_prefix
+        self.trace_memory = trace_memory
+        self.profile = cProfile.Profile()
+        self.snapshots = []
+
+    def start(self) -> None:
+        """
+        Starts profiling (and tracing the memory allocations, if enabled).
+        """
+        if self.trace_memory:
+            tracemalloc.start()
+        self.profile.enable()
+
+    def stage(self, name: str) -> None:
+        """
+        Marks the end of a pipeline stage, taking a memory snapshot if enabled.
+        The profiler stays enabled, as disabling it would lose the calling context of the next
+        stages, so the snapshot time is attributed to this method.
+
+        Args:
+            name (str): Name of the stage that just finished.
+        """
+        if self.trace_memory:
+            self.snapshots.append((name, tracemalloc.take_snapshot()))
+
+    def stop(self) -> list[str]:
+        """
+        Stops profiling and writes the output files.
+
+        Returns:
+            list: Paths of the written files.
+        """
+        self.profile.disable()
+        paths = [self.output_prefix + PSTATS_SUFFIX, self.output_prefix + COLLAPSED_SUFFIX]
+        self.profile.dump_stats(paths[0])
+        stats = pstats.Stats(self.profile)
+        with open(paths[1], "w", encoding="utf-8") as collapsed_file:
+            for stack, microseconds in sorted(ProfileUtil.collapse_stacks(stats).items()):
+                collapsed_file.write(f"{stack} {microseconds}\n")
+
+        if self.trace_memory:
+            tracemalloc.stop()
+            paths.append(self.output_prefix + MEMORY_SUFFIX)
+            with open(paths[2], "w", encoding="utf-8") as memory_file:
+                memory_file.write(ProfileUtil.format_snapshots(self.snapshots))
+        return paths
+
+
+class ProfileUtil:
+    """
+    Utility class for converting profiling data.
+    """
+
+    @staticmethod
+    def collapse_stacks(stats: pstats.Stats) -> dict:
+        """
+        Rebuilds collapsed stacks ("root;caller;function microseconds") from the cProfile call graph.
+
+        cProfile only records caller/callee pairs, so the time of a function is split between its
+        stacks in proportion to the cumulative time of each call edge, as flameprof does.
+
+        Args:
+            stats (pstats.Stats): The profiling statistics.
+
+        Returns:
+            dict: Self time in microseconds of each stack.
+        """
+        # Roots are functions without callers and calls from frames entered before profiling
+        # started (e.g. the function that enabled the profiler), which have no stats of their own
+        callees = {}
+        roots = []
+        for function, (_, _, _, cumulative_time, callers) in stats.stats.items():
+            if not callers:
+                roots.append((function, (), cumulative_time))
+            for caller, (_, _, _, edge_cumulative) in callers.items():
+                if caller in stats.stats:
+                    callees.setdefault(caller, []).append((function, edge_cumulative))
+                else:
+                    roots.append((function, (ProfileUtil.format_function(caller),), edge_cumulative))
+
+        stacks = {}
+
+        def visit(function, path: tuple, share: float) -> None:
+            _, _, total_time, cumulative_time, _ = stats.stats[function]
+            fraction = share / cumulative_time if cumulative_time else 0.0
+            path = path + (ProfileUtil.format_function(function),)
+            self_time = int(total_time * fraction * 1e6)
+            if self_time:
+                stack = ";".join(path)
+                stacks[stack] = stacks.get(stack, 0) + self_time
+            for callee, edge_cumulative in callees.get(function, ()):
+                if ProfileUtil.format_function(callee) not in path:
+                    visit(callee, path, edge_cumulative * fraction)
+
+        for function, path, share in roots:
+            visit(function, path, share)
+        return stacks
+
+    @staticmethod
+    def format_function(function: tuple) -> str:
+        """
+        Formats a pstats function key (file, line, name) as a stack frame.
+
+        Args:
+            function (tuple): The (file, line, name) key.
+
+        Returns:
+            str: The frame, e.g. "tax_service.py:72(calculate_tax)".
+        """
+        file, line, name = function
+        if file == "~":
+            return name.replace(";", ",").replace(" ", "_")
+        return f"{os.path.basename(file)}:{line}({name})".replace(" ", "_")
+
+    @staticmethod
+    def format_snapshots(snapshots: list) -> str:
+        """
+        Formats the traced memory of each stage and the top allocations added by it.
+
+        Args:
+            snapshots (list): (stage name, tracemalloc.Snapshot) pairs, in order.
+
+        Returns:
+            str: The memory report.
+        """
+        lines = []
+        previous = None
+        for name, snapshot in snapshots:
+            snapshot = snapshot.filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),))
+            total = sum(stat.size for stat in snapshot.statistics("filename"))
+            lines.append(f"== {name}: {total / 1024:.1f} KiB traced")
+            top_stats = snapshot.compare_to(previous, "lineno") if previous else snapshot.statistics("lineno")
+            lines.extend(f"  {stat}" for stat in top_stats[:MEMORY_TOP_STATS])
+            previous = snapshot
+        return "\n".join(lines) + "\n"
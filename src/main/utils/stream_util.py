@@ -0,0 +1,176 @@
+"""
+Stream util for application. It provides utility functions for opening input and output streams,
+transparently handling gzip, bz2 and lzma (xz) compression.
+"""
+import io
+
+# Large buffers keep decompression from being dominated by small read/write calls
+STREAM_BUFFER_SIZE = 1024 * 1024
+
+COMPRESSION_MAGIC_BYTES = {
+    "gzip": b"\x1f\x8b",
+    "bz2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+}
+HEADER_SIZE = max(len(magic) for magic in COMPRESSION_MAGIC_BYTES.values())
+
+# The compression modules are only imported when a compressed stream is actually used
+COMPRESSION_MODULES = {
+    "gzip": "gzip",
+    "bz2": "bz2",
+    "xz": "lzma",
+}
+
+
+class StreamUtil:
+    """
+    Utility class for opening (possibly compressed) text streams.
+    """
+
+    @staticmethod
+    def detect_compression(header: bytes):
+        """
+        Detects the compression format from the first bytes of a stream.
+
+        Args:
+            header (bytes): The first bytes of the stream.
+
+        Returns:
+            str or None: "gzip", "bz2", "xz" or None for uncompressed data.
+        """
+        for compression, magic in COMPRESSION_MAGIC_BYTES.items():
+            if header.startswith(magic):
+                return compression
+        return None
+
+    @staticmethod
+    def open_input(binary_stream, buffer_size: int = STREAM_BUFFER_SIZE) -> io.TextIOBase:
+        """
+        Wraps a binary stream in a text stream, decompressing it on the fly when it starts with
+        gzip, bz2 or xz magic bytes.
+
+        Args:
+            binary_stream: Readable binary stream (e.g. sys.stdin.buffer or a file opened with "rb").
+            buffer_size (int): Size of the read buffer.
+
+        Returns:
+            io.TextIOBase: Text stream yielding the decompressed lines.
+        """
+        header = binary_stream.peek(HEADER_SIZE)[:HEADER_SIZE] if hasattr(binary_stream, "peek") else b""
+        if len(header) == HEADER_SIZE:
+            buffered = binary_stream
+        else:
+            # A pipe may deliver fewer bytes than the header at a time, so it is read until complete
+            # and then put back in front of the rest of the stream
+            header = StreamUtil.read_header(binary_stream)
+            buffered = io.BufferedReader(_PrefixedReader(header, binary_stream), buffer_size)
+        compression = StreamUtil.detect_compression(header)
+        if compression is None:
+            return io.TextIOWrapper(buffered, encoding="utf-8")
+
+        decompressed = StreamUtil.open_compressed(buffered, compression, "rb")
+        return io.TextIOWrapper(io.BufferedReader(decompressed, buffer_size), encoding="utf-8")
+
+    @staticmethod
+    def read_header(binary_stream) -> bytes:
+        """
+        Reads the first HEADER_SIZE bytes of a stream, or fewer if it ends before.
+
+        Args:
+            binary_stream: Readable binary stream, whose reads may return fewer bytes than requested.
+
+        Returns:
+            bytes: The bytes read.
+        """
+        header = b""
+        while len(header) < HEADER_SIZE:
+            chunk = binary_stream.read(HEADER_SIZE - len(header))
+            if not chunk:
+                break
+            header += chunk
+        return header
+
+    @staticmethod
+    def open_output(binary_stream, compression=None, buffer_size: int = STREAM_BUFFER_SIZE) -> io.TextIOBase:
+        """
+        Wraps a binary stream in a text stream, compressing the written data when requested.
+
+        Args:
+            binary_stream: Writable binary stream (e.g. sys.stdout.buffer or a file opened with "wb").
+            compression (str or None): "gzip", "bz2", "xz" or None for plain text.
+            buffer_size (int): Size of the write buffer.
+
+        Returns:
+            io.TextIOBase: Text stream. Closing it flushes the compressor but keeps binary_stream open.
+        """
+        if compression is None:
+            target = binary_stream
+        else:
+            target = StreamUtil.open_compressed(binary_stream, compression, "wb")
+
+        return io.TextIOWrapper(io.BufferedWriter(_NonClosingWriter(target, compression is not None),
+                                                  buffer_size), encoding="utf-8")
+
+    @staticmethod
+    def open_compressed(binary_stream, compression: str, mode: str):
+        """
+        Wraps a binary stream in the (de)compressor of the given format.
+
+        Args:
+            binary_stream: Binary stream to wrap.
+            compression (str): "gzip", "bz2" or "xz".
+            mode (str): "rb" or "wb".
+
+        Returns:
+            The compressed file object (GzipFile, BZ2File or LZMAFile).
+        """
+        if compression not in COMPRESSION_MODULES:
+            raise ValueError(f"Unsupported compression: {compression}")
+        return __import__(COMPRESSION_MODULES[compression]).open(binary_stream, mode)
+
+
+class _NonClosingWriter(io.RawIOBase):
+    """
+    Raw writer that closes the compressor (if any) but never the underlying stream.
+    """
+
+    def __init__(self, target, compressed: bool) -> None:
+        self.target = target
+        self.compressed = compressed
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.target.write(data)
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            if self.compressed:
+                self.target.close()
+            else:
+                self.target.flush()
+        super().close()
+
+
+class _PrefixedReader(io.RawIOBase):
+    """
+    Raw reader returning the already read prefix, then the rest of the source stream.
+    Like _NonClosingWriter, it never closes the source stream.
+    """
+
+    def __init__(self, prefix: bytes, source) -> None:
+        self.prefix = prefix
+        self.source = source
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self.prefix:
+            size = min(len(buffer), len(self.prefix))
+            buffer[:size] = self.prefix[:size]
+            self.prefix = self.prefix[size:]
+            return size
+        return self.source.readinto(buffer)
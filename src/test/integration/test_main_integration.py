@@ -1,7 +1,15 @@
+import gzip
+import lzma
 import unittest
 import subprocess
+import tempfile
 import sys
 import os
+import io
+import signal
+import time
+from unittest import mock
+from src.main import main
 
 
 class TestMainIntegration(unittest.TestCase):
@@ -42,6 +50,146 @@ class TestMainIntegration(unittest.TestCase):
         # Then
         self.assertEqual(actual, expected)
 
+    def test_main_with_compressed_input_and_output(self):
+        # Given
+        sample_input = (
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000},{"operation":"sell", "unit-cost":20.00, "quantity": 5000}]\n'
+        )
+
+        expected = "[[{'tax': 0.0}, {'tax': 10000.0}]]"
+
+        main_path = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+            "main", "main.py"
+        )
+        env = os.environ.copy()
+        project_root = os.path.dirname(os.path.dirname(
+            os.path.dirname(os.path.dirname(__file__))))
+        env["PYTHONPATH"] = project_root + \
+            os.pathsep + env.get("PYTHONPATH", "")
+
+        # When
+        result = subprocess.run(
+            [sys.executable, main_path, "--compress", "xz"],
+            input=gzip.compress(sample_input.encode()),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env
+        )
+
+        actual = lzma.decompress(result.stdout).decode().strip()
+
+        # Then
+        self.assertEqual(actual, expected)
+
+    def run_main(self, args, stdin=b""):
+        command, env = self.main_command(args)
+        return subprocess.run(
+            command,
+            input=stdin,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env
+        )
+
+    def main_command(self, args):
+        main_path = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+            "main", "main.py"
+        )
+        env = os.environ.copy()
+        project_root = os.path.dirname(os.path.dirname(
+            os.path.dirname(os.path.dirname(__file__))))
+        env["PYTHONPATH"] = project_root + \
+            os.pathsep + env.get("PYTHONPATH", "")
+        return [sys.executable, main_path] + args, env
+
+    def test_main_keeps_stdin_open(self):
+        # Given
+        stdin = io.TextIOWrapper(io.BufferedReader(io.BytesIO(
+            b'[{"operation":"buy", "unit-cost":10.00, "quantity": 10000}]\n')), encoding="utf-8")
+        stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+
+        # When
+        with mock.patch.object(sys, "stdin", stdin), mock.patch.object(sys, "stdout", stdout):
+            main.main([])
+
+        # Then
+        self.assertFalse(stdin.buffer.closed)
+        self.assertEqual(stdout.buffer.getvalue(), b"[[{'tax': 0.0}]]")
+
+    def test_main_rejects_intern_size_below_one(self):
+        # When
+        result = self.run_main(["--intern", "0"])
+
+        # Then
+        self.assertEqual(result.returncode, 2)
+        self.assertIn(b"--intern must be at least 1", result.stderr)
+
+    def test_main_stream_keeps_results_written_before_an_error(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Given
+            input_path = os.path.join(directory, "operations.txt")
+            output_path = os.path.join(directory, "taxes.txt")
+            with open(input_path, "w") as input_file:
+                input_file.write(
+                    '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000},{"operation":"sell", "unit-cost":20.00, "quantity": 5000}]\n'
+                    '[{"operation":"bad"}]\n'
+                )
+
+            # When
+            result = self.run_main(["--stream", "-i", input_path, "-o", output_path])
+
+            # Then
+            self.assertNotEqual(result.returncode, 0)
+            with open(output_path) as output_file:
+                self.assertTrue(output_file.read().startswith("[[{'tax': 0.0}, {'tax': 10000.0}], ["))
+
+
+    def test_main_merge_keeps_results_written_before_an_error(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Given
+            input_path = os.path.join(directory, "operations.jsonl")
+            output_path = os.path.join(directory, "taxes.txt")
+            with open(input_path, "w") as input_file:
+                input_file.write(
+                    '{"timestamp": 1, "account": "a", "operation":"buy", "unit-cost":10.00, "quantity": 10000}\n'
+                    '{"timestamp": 2, "account": "a", "operation":"bad"}\n'
+                )
+
+            # When
+            result = self.run_main(["--merge", input_path, "-o", output_path])
+
+            # Then
+            self.assertNotEqual(result.returncode, 0)
+            with open(output_path) as output_file:
+                self.assertEqual(output_file.read(), "{'timestamp': 1, 'account': 'a', 'tax': 0.0}\n")
+
+
+    def test_main_follow_with_intern_prints_stats_when_stopped(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Given
+            input_path = os.path.join(directory, "operations.txt")
+            output_path = os.path.join(directory, "taxes.txt")
+            with open(input_path, "w") as input_file:
+                input_file.write(
+                    '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000}, {"operation":"buy", "unit-cost":10.00, "quantity": 10000}]\n')
+            command, env = self.main_command(["--follow", "-i", input_path, "-o", output_path, "--intern", "5"])
+
+            # When
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
+            deadline = time.monotonic() + 10
+            while not os.path.exists(output_path + ".offset") and time.monotonic() < deadline:
+                time.sleep(0.05)
+            process.send_signal(signal.SIGINT)
+            _, stderr = process.communicate(timeout=10)
+
+            # Then
+            self.assertEqual(process.returncode, 0)
+            self.assertIn(b"Interned operations: 1, hits: 1, misses: 1", stderr)
+            with open(output_path) as output_file:
+                self.assertEqual(output_file.read(), "[{'tax': 0.0}, {'tax': 0.0}]\n")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+import unittest
+
+# Cumulative import time budget of src.main.main, in microseconds
+IMPORT_TIME_BUDGET_US = int(os.environ.get("IMPORT_TIME_BUDGET_US", 60000))
+
+# Modules only needed by optional features, which must not be imported at startup
+LAZY_MODULES = ("argparse", "sqlite3", "gzip", "bz2", "lzma",
+                "dataclasses", "inspect", "typing", "cProfile", "pstats",
+                "concurrent.futures", "importlib")
+
+
+class TestStartupIntegration(unittest.TestCase):
+    def import_times(self) -> dict:
+        project_root = os.path.dirname(os.path.dirname(
+            os.path.dirname(os.path.dirname(__file__))))
+        env = os.environ.copy()
+        env["PYTHONPATH"] = project_root + \
+            os.pathsep + env.get("PYTHONPATH", "")
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import src.main.main"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env
+        )
+        self.assertEqual(result.returncode, 0, result.stderr.decode())
+
+        # Lines look like "import time:       self |  cumulative | module"
+        times = {}
+        for line in result.stderr.decode().splitlines():
+            if not line.startswith("import time:") or "[us]" in line:
+                continue
+            _, cumulative, module = line[len("import time:"):].split("|")
+            times[module.strip()] = int(cumulative)
+        return times
+
+    def test_main_does_not_import_optional_modules(self):
+        # When
+        times = self.import_times()
+
+        # Then
+        self.assertEqual([module for module in LAZY_MODULES if module in times], [])
+
+    def test_main_import_time_budget(self):
+        # When
+        times = self.import_times()
+
+        # Then
+        self.assertLess(times["src.main.main"], IMPORT_TIME_BUDGET_US)
+
+
+if __name__ == "__main__":
+    unittest.main()
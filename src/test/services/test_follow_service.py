@@ -0,0 +1,153 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from src.main.services.follow_service import FollowService
+
+BUY_AND_SELL = '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000},{"operation":"sell", "unit-cost":20.00, "quantity": 5000}]\n'
+SMALL_BUY_AND_SELL = '[{"operation":"buy", "unit-cost":10.00, "quantity": 100},{"operation":"sell", "unit-cost":15.00, "quantity": 50}]\n'
+
+INVALID = '[{"operation":"bad"}]\n'
+
+
+class TestFollowService(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.input_path = os.path.join(self.directory.name, "operations.txt")
+        self.output_path = os.path.join(self.directory.name, "taxes.txt")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def append(self, text):
+        with open(self.input_path, "a") as input_file:
+            input_file.write(text)
+
+    def read_output(self):
+        with open(self.output_path) as output_file:
+            return output_file.read().splitlines()
+
+    def test_poll_processes_only_complete_appended_lines(self):
+        # Given
+        follow_service = FollowService(self.input_path, self.output_path)
+        self.append(BUY_AND_SELL + SMALL_BUY_AND_SELL[:20])
+
+        # When
+        first = follow_service.poll()
+        self.append(SMALL_BUY_AND_SELL[20:])
+        second = follow_service.poll()
+        third = follow_service.poll()
+
+        # Then
+        self.assertEqual((first, second, third), (1, 1, 0))
+        self.assertEqual(self.read_output(), [
+            "[{'tax': 0.0}, {'tax': 10000.0}]",
+            "[{'tax': 0.0}, {'tax': 0.0}]"
+        ])
+
+    def test_restart_continues_from_persisted_offset(self):
+        # Given
+        self.append(BUY_AND_SELL)
+        FollowService(self.input_path, self.output_path).poll()
+        self.append(SMALL_BUY_AND_SELL)
+
+        # When
+        follow_service = FollowService(self.input_path, self.output_path)
+        follow_service.follow(max_polls=2)
+
+        # Then
+        self.assertEqual(self.read_output(), [
+            "[{'tax': 0.0}, {'tax': 10000.0}]",
+            "[{'tax': 0.0}, {'tax': 0.0}]"
+        ])
+        with open(self.output_path + ".offset") as offset_file:
+            self.assertEqual(int(offset_file.readline()), len(BUY_AND_SELL) + len(SMALL_BUY_AND_SELL))
+
+    def test_poll_missing_input(self):
+        # Given
+        follow_service = FollowService(self.input_path, self.output_path)
+
+        # Then
+        self.assertEqual(follow_service.poll(), 0)
+        self.assertFalse(os.path.exists(self.output_path))
+
+    def test_truncated_input_is_read_again(self):
+        # Given
+        follow_service = FollowService(self.input_path, self.output_path)
+        self.append(BUY_AND_SELL + BUY_AND_SELL)
+        follow_service.poll()
+        os.remove(self.input_path)
+        self.append(SMALL_BUY_AND_SELL)
+
+        # When
+        actual = follow_service.poll()
+
+        # Then
+        self.assertEqual(actual, 1)
+        self.assertEqual(self.read_output()[-1], "[{'tax': 0.0}, {'tax': 0.0}]")
+
+    def test_invalid_line_is_skipped(self):
+        # Given
+        follow_service = FollowService(self.input_path, self.output_path)
+        self.append(BUY_AND_SELL + INVALID + SMALL_BUY_AND_SELL)
+
+        # When
+        with contextlib.redirect_stderr(io.StringIO()) as stderr:
+            actual = follow_service.poll()
+
+        # Then
+        self.assertEqual(actual, 3)
+        self.assertIn("Skipping invalid line", stderr.getvalue())
+        self.assertEqual(self.read_output(), [
+            "[{'tax': 0.0}, {'tax': 10000.0}]",
+            "[{'tax': 0.0}, {'tax': 0.0}]"
+        ])
+        with open(self.output_path + ".offset") as offset_file:
+            self.assertEqual(int(offset_file.readline()), len(BUY_AND_SELL) + len(INVALID) + len(SMALL_BUY_AND_SELL))
+
+    def test_poll_reads_in_bounded_chunks(self):
+        # Given
+        follow_service = FollowService(self.input_path, self.output_path, chunk_size=16)
+        self.append(BUY_AND_SELL * 3 + SMALL_BUY_AND_SELL[:20])
+        offsets = []
+        save_offset = follow_service._FollowService__save_offset
+
+        def record_offset():
+            offsets.append(follow_service.offset)
+            save_offset()
+
+        follow_service._FollowService__save_offset = record_offset
+
+        # When
+        actual = follow_service.poll()
+
+        # Then
+        self.assertEqual(actual, 3)
+        self.assertEqual(offsets, [len(BUY_AND_SELL), 2 * len(BUY_AND_SELL), 3 * len(BUY_AND_SELL)])
+        self.assertEqual(len(self.read_output()), 3)
+
+
+    def test_restart_drops_results_written_after_the_saved_offset(self):
+        # Given
+        self.append(BUY_AND_SELL)
+        FollowService(self.input_path, self.output_path).poll()
+        self.append(SMALL_BUY_AND_SELL)
+        # The process wrote the result of the new line but crashed before saving the offset
+        with open(self.output_path, "a") as output_file:
+            output_file.write("[{'tax': 0.0}, {'tax': 0.0}]\n")
+
+        # When
+        follow_service = FollowService(self.input_path, self.output_path)
+        actual = follow_service.poll()
+
+        # Then
+        self.assertEqual(actual, 1)
+        self.assertEqual(self.read_output(), [
+            "[{'tax': 0.0}, {'tax': 10000.0}]",
+            "[{'tax': 0.0}, {'tax': 0.0}]"
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
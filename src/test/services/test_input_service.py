@@ -1,3 +1,4 @@
+import io
 import unittest
 from src.main.services.input_service import InputService
 from src.main.services.operation_service import OperationService
@@ -70,6 +71,29 @@ class TestInputService(unittest.TestCase):
         with self.assertRaises(OperationProcessingError):
             self.input_service.process_input(lines)
 
+    def test_process_stream_matches_process_input(self):
+        # Given
+        lines = [
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000}, {"operation":"sell", "unit-cost":20.00, "quantity": 5000}]\n',
+            '\n',
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 100}, {"operation":"sell", "unit-cost":15.00, "quantity": 50}]\n'
+        ]
+        output = io.StringIO()
+
+        # When
+        self.input_service.process_stream(io.StringIO("".join(lines)), output)
+
+        # Then
+        self.assertEqual(output.getvalue(), str(self.input_service.process_input(lines)))
+
+    def test_process_stream_invalid_json(self):
+        # Given
+        stream = io.StringIO('[{"operation":"buy", "unit-cost":10.00, "quantity": 100}')
+
+        # Then
+        with self.assertRaises(OperationProcessingError):
+            self.input_service.process_stream(stream, io.StringIO())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,120 @@
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+from src.main.services.merge_service import MergeService
+from src.main.services.tax_service import TaxService
+from src.main.dto.operation_dto import OperationDto
+from src.main.exceptions.exception import OperationProcessingError
+
+
+def tagged_lines(operations) -> str:
+    return "".join(json.dumps({"timestamp": timestamp, "account": account, "operation": operation,
+                               "unit-cost": unit_cost, "quantity": quantity}) + "\n"
+                   for timestamp, account, operation, unit_cost, quantity in operations)
+
+
+VENUE_1 = [
+    (1, "a", "buy", 10.00, 10000),
+    (4, "a", "sell", 20.00, 5000),
+    (6, "b", "sell", 20.00, 3000),
+]
+VENUE_2 = [
+    (2, "b", "buy", 10.00, 10000),
+    (3, "a", "sell", 5.00, 1000),
+    (5, "b", "sell", 5.00, 5000),
+]
+
+
+class TestMergeService(unittest.TestCase):
+    def setUp(self):
+        self.merge_service = MergeService()
+
+    def test_process_streams_merges_by_timestamp(self):
+        # Given
+        streams = [("venue1", io.StringIO(tagged_lines(VENUE_1))),
+                   ("venue2", io.StringIO(tagged_lines(VENUE_2)))]
+        output = io.StringIO()
+
+        # When
+        ledgers = self.merge_service.process_streams(streams, output)
+
+        # Then
+        self.assertEqual(output.getvalue().splitlines(), [
+            "{'timestamp': 1, 'account': 'a', 'tax': 0.0}",
+            "{'timestamp': 2, 'account': 'b', 'tax': 0.0}",
+            "{'timestamp': 3, 'account': 'a', 'tax': 0.0}",
+            "{'timestamp': 4, 'account': 'a', 'tax': 9000.0}",
+            "{'timestamp': 5, 'account': 'b', 'tax': 0.0}",
+            "{'timestamp': 6, 'account': 'b', 'tax': 1000.0}",
+        ])
+        self.assertEqual(sorted(ledgers), ["a", "b"])
+
+    def test_process_streams_matches_tax_service_per_account(self):
+        # Given
+        streams = [("venue1", io.StringIO(tagged_lines(VENUE_1))),
+                   ("venue2", io.StringIO(tagged_lines(VENUE_2)))]
+        merged = sorted(VENUE_1 + VENUE_2)
+        tax_service = TaxService()
+
+        # When
+        ledgers = self.merge_service.process_streams(streams, io.StringIO())
+
+        # Then
+        for account in ("a", "b"):
+            operations = [OperationDto(operation, unit_cost, quantity)
+                          for _, op_account, operation, unit_cost, quantity in merged if op_account == account]
+            _, expected, _ = tax_service.calculate_taxes_and_ledger(operations)
+            self.assertEqual(ledgers[account], expected)
+
+    def test_process_streams_keeps_stream_order_on_ties(self):
+        # Given
+        streams = [("venue1", io.StringIO(tagged_lines([(1, "a", "buy", 10.00, 100)]))),
+                   ("venue2", io.StringIO(tagged_lines([(1, "b", "buy", 10.00, 100)])))]
+        output = io.StringIO()
+
+        # When
+        self.merge_service.process_streams(streams, output)
+
+        # Then
+        self.assertEqual([line.split("'account': ")[1][1] for line in output.getvalue().splitlines()],
+                         ["a", "b"])
+
+    def test_process_streams_unsorted_input(self):
+        # Given
+        streams = [("venue1", io.StringIO(tagged_lines(list(reversed(VENUE_1)))))]
+
+        # Then
+        with self.assertRaises(OperationProcessingError):
+            self.merge_service.process_streams(streams, io.StringIO())
+
+    def test_process_streams_missing_account(self):
+        # Given
+        streams = [("venue1", io.StringIO('{"timestamp": 1, "operation":"buy", "unit-cost":10.00, "quantity": 100}\n'))]
+
+        # Then
+        with self.assertRaises(OperationProcessingError):
+            self.merge_service.process_streams(streams, io.StringIO())
+
+    def test_process_files_with_compressed_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Given
+            path_1 = os.path.join(directory, "venue1.jsonl")
+            path_2 = os.path.join(directory, "venue2.jsonl.gz")
+            with open(path_1, "w") as file:
+                file.write(tagged_lines(VENUE_1))
+            with gzip.open(path_2, "wt") as file:
+                file.write(tagged_lines(VENUE_2))
+            output = io.StringIO()
+
+            # When
+            self.merge_service.process_files([path_1, path_2], output)
+
+            # Then
+            self.assertEqual(len(output.getvalue().splitlines()), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
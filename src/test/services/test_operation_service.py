@@ -1,7 +1,10 @@
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from src.main.services.operation_service import OperationService
 from src.main.services.tax_service import TaxService
+from src.main.utils.tax_util import TaxUtil
 from src.main.dto.operation_dto import OperationDto, OperationTypeEnum
+from src.main.exceptions.exception import OperationProcessingError
 
 
 class TestOperationService(unittest.TestCase):
@@ -47,6 +50,58 @@ class TestOperationService(unittest.TestCase):
         with self.assertRaises(Exception):
             self.operation_service.process_operations(operations)
 
+    def test_process_operations_with_thread_pool_matches_sequential(self):
+        # Given
+        operations = [
+            [
+                OperationDto(OperationTypeEnum.BUY, 10.00, 10000),
+                OperationDto(OperationTypeEnum.SELL, 5.00 + line, 5000),
+                OperationDto(OperationTypeEnum.SELL, 20.00, 3000 + line)
+            ]
+            for line in range(200)
+        ]
+        expected = self.operation_service.process_operations(operations)
+
+        # When
+        with ThreadPoolExecutor(8) as executor:
+            actual = OperationService(executor=executor).process_operations(operations)
+
+        # Then
+        self.assertEqual(actual, expected)
+
+    def test_process_operations_with_thread_pool_writes_sink_in_order(self):
+        # Given
+        operations = [[OperationDto(OperationTypeEnum.BUY, 10.00, line + 1)] for line in range(50)]
+        written = []
+
+        class ListSink:
+            def write_line(self, line_index, operation_dto_list, operation_taxes, ledger, executed_quantities):
+                written.append((line_index, ledger.total_qty))
+
+        # When
+        with ThreadPoolExecutor(4) as executor:
+            OperationService(executor=executor).process_operations(operations, ListSink())
+
+        # Then
+        self.assertEqual(written, [(line, line + 1) for line in range(50)])
+
+    def test_process_operations_with_thread_pool_invalid_input(self):
+        # Given
+        operations = [{"operation": "buy"}]
+
+        # Then
+        with ThreadPoolExecutor(2) as executor:
+            with self.assertRaises(OperationProcessingError):
+                OperationService(executor=executor).process_operations(operations)
+
+    def test_services_are_safe_to_share_across_threads(self):
+        # Audit: the shared TaxService only holds immutable configuration and TaxUtil is stateless
+        tax_service = TaxService()
+        self.assertTrue(all(isinstance(value, (int, float, str, bool))
+                            for value in vars(tax_service).values()))
+        self.assertTrue(all(isinstance(value, staticmethod)
+                            for name, value in vars(TaxUtil).items() if not name.startswith("__")))
+
 
 if __name__ == "__main__":
     unittest.main()
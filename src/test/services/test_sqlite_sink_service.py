@@ -0,0 +1,128 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from src.main.services.sqlite_sink_service import SqliteSinkService
+from src.main.services.operation_service import OperationService
+from src.main.dto.operation_dto import OperationDto, OperationTypeEnum
+from src.main.exceptions.exception import OperationProcessingError
+
+
+class TestSqliteSinkService(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.database_path = os.path.join(self.directory.name, "results.db")
+        self.operations = [
+            [
+                OperationDto(OperationTypeEnum.BUY, 10.00, 10000),
+                OperationDto(OperationTypeEnum.SELL, 20.00, 5000)
+            ],
+            [
+                OperationDto(OperationTypeEnum.BUY, 10.00, 100),
+                OperationDto(OperationTypeEnum.SELL, 15.00, 50)
+            ]
+        ]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_write_lines_and_find_taxed_sells(self):
+        # Given
+        operation_service = OperationService()
+
+        # When
+        with SqliteSinkService(self.database_path, batch_size=1) as sink:
+            results = operation_service.process_operations(self.operations, sink)
+        actual = SqliteSinkService.find_taxed_sells(self.database_path, 20000.0)
+
+        # Then
+        self.assertEqual(results, [[{"tax": 0.0}, {"tax": 10000.0}], [{"tax": 0.0}, {"tax": 0.0}]])
+        self.assertEqual(len(actual), 1)
+        self.assertEqual(actual[0]["line_index"], 0)
+        self.assertEqual(actual[0]["operation_index"], 1)
+        self.assertEqual(actual[0]["total_value"], 100000.0)
+        self.assertEqual(actual[0]["tax"], 10000.0)
+
+    def test_ledgers_are_stored_per_line(self):
+        # When
+        with SqliteSinkService(self.database_path) as sink:
+            OperationService().process_operations(self.operations, sink)
+
+        # Then
+        connection = sqlite3.connect(self.database_path)
+        ledgers = connection.execute(
+            "SELECT line_index, weighted_avg, total_qty, accumulated_loss FROM ledgers "
+            "ORDER BY line_index").fetchall()
+        journal_mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+        connection.close()
+        self.assertEqual(ledgers, [(0, 10.0, 5000, 0.0), (1, 10.0, 50, 0.0)])
+        self.assertEqual(journal_mode, "wal")
+
+    def test_runs_are_kept_separately(self):
+        # When
+        with SqliteSinkService(self.database_path) as sink:
+            OperationService().process_operations(self.operations, sink)
+        with SqliteSinkService(self.database_path) as sink:
+            OperationService().process_operations(self.operations, sink)
+            run_id = sink.run_id
+
+        # Then
+        self.assertEqual(len(SqliteSinkService.find_taxed_sells(self.database_path)), 2)
+        self.assertEqual(len(SqliteSinkService.find_taxed_sells(self.database_path, run_id=run_id)), 1)
+
+    def test_total_value_uses_executed_quantity(self):
+        # Given
+        operations = [[
+            OperationDto(OperationTypeEnum.BUY, 10.00, 1000),
+            OperationDto(OperationTypeEnum.SELL, 50.00, 5000)
+        ]]
+
+        # When
+        with SqliteSinkService(self.database_path) as sink:
+            OperationService().process_operations(operations, sink)
+        actual = SqliteSinkService.find_taxed_sells(self.database_path, 20000.0)
+
+        # Then
+        self.assertEqual(len(actual), 1)
+        self.assertEqual(actual[0]["quantity"], 5000)
+        self.assertEqual(actual[0]["executed_quantity"], 1000)
+        self.assertEqual(actual[0]["total_value"], 50000.0)
+
+    def test_failed_run_is_rolled_back(self):
+        # Given
+        operations = self.operations + [[{"operation": "buy"}]]
+
+        # When
+        for batch_size, transaction_size in ((10000, 500000), (1, 1)):
+            with self.assertRaises(OperationProcessingError):
+                with SqliteSinkService(self.database_path, batch_size, transaction_size) as sink:
+                    OperationService().process_operations(operations, sink)
+
+        # Then
+        connection = sqlite3.connect(self.database_path)
+        counts = [connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                  for table in ("runs", "operation_taxes", "ledgers")]
+        connection.close()
+        self.assertEqual(counts, [0, 0, 0])
+
+
+    def test_interrupted_run_is_not_returned(self):
+        # Given
+        interrupted = SqliteSinkService(self.database_path, batch_size=1, transaction_size=1)
+        OperationService().process_operations(self.operations, interrupted)
+
+        # When
+        # The process dies: the rows already committed stay, but the run is never closed
+        interrupted.connection.close()
+        with SqliteSinkService(self.database_path) as sink:
+            OperationService().process_operations(self.operations, sink)
+            run_id = sink.run_id
+
+        # Then
+        actual = SqliteSinkService.find_taxed_sells(self.database_path)
+        self.assertEqual([row["run_id"] for row in actual], [run_id])
+        self.assertEqual(SqliteSinkService.find_taxed_sells(self.database_path, run_id=interrupted.run_id), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
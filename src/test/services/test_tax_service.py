@@ -142,6 +142,25 @@ class TestTaxService(unittest.TestCase):
 
         self.check_calculate_taxes(operations, expected)
 
+    def test_calculate_taxes_and_ledger(self):
+        # Given
+        operations = [
+            OperationDto(OperationTypeEnum.BUY, 10.00, 10000),
+            OperationDto(OperationTypeEnum.SELL, 5.00, 5000),
+            OperationDto(OperationTypeEnum.BUY, 20.00, 5000),
+            OperationDto(OperationTypeEnum.SELL, 20.00, 20000)
+        ]
+
+        # When
+        taxes, ledger, executed_quantities = self.tax_service.calculate_taxes_and_ledger(operations)
+
+        # Then
+        self.assertEqual(taxes, [{"tax": 0.0}, {"tax": 0.0}, {"tax": 0.0}, {"tax": 5000.0}])
+        self.assertEqual(executed_quantities, [10000, 5000, 5000, 10000])
+        self.assertEqual(ledger.weighted_avg, 15.0)
+        self.assertEqual(ledger.total_qty, 0)
+        self.assertEqual(ledger.accumulated_loss, 0.0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
+import io
 import unittest
 from src.main.exceptions.exception import OperationProcessingError
-from src.main.utils.operation_util import OperationUtil
+from src.main.utils.operation_util import OperationUtil, OperationInterner
 from src.main.dto.operation_dto import OperationDto, OperationTypeEnum
 
 
@@ -58,6 +59,149 @@ class TestOperationUtil(unittest.TestCase):
         with self.assertRaises(OperationProcessingError):
             OperationUtil.format_operations_file(lines)
 
+    def test_stream_operations_valid_with_small_chunks(self):
+        # Given
+        stream = io.StringIO(
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000} , {"operation":"sell", "unit-cost":20.00, "quantity": 5000}]\n'
+            '\n'
+            '  []  \n'
+            '[{"operation":"buy", "unit-cost":20.00, "quantity": 10000}]'
+        )
+
+        # When
+        actual = [list(operations) for operations in OperationUtil.stream_operations(stream, chunk_size=7)]
+
+        # Then
+        self.assertEqual([len(operations) for operations in actual], [2, 0, 1])
+        self.assertEqual(actual[0][0].operation, OperationTypeEnum.BUY)
+        self.assertEqual(actual[0][1].operation, OperationTypeEnum.SELL)
+        self.assertEqual(actual[0][1].unit_cost, 20.00)
+        self.assertEqual(actual[2][0].quantity, 10000)
+
+    def test_stream_operations_invalid_input(self):
+        for line in (
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000}',
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000}\n[]',
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000}] x',
+            '{"operation":"buy", "unit-cost":10.00, "quantity": 10000}',
+            '[{"operation":"invalid", "unit-cost":10.00, "quantity": 10000}]',
+        ):
+            # Given
+            stream = io.StringIO(line)
+
+            # Then
+            with self.assertRaises(OperationProcessingError):
+                for operations in OperationUtil.stream_operations(stream, chunk_size=5):
+                    list(operations)
+
+    def test_stream_operations_rejects_objects_spanning_lines(self):
+        for chunk_size in (3, 64 * 1024):
+            for interner in (None, OperationInterner()):
+                # Given
+                stream = io.StringIO('[{"operation":"buy", "unit-cost":10.00,\n "quantity": 10000}]\n')
+
+                # Then
+                with self.assertRaisesRegex(OperationProcessingError, "Invalid input at line 1"):
+                    for operations in OperationUtil.stream_operations(stream, chunk_size, interner):
+                        list(operations)
+
+    def test_format_operations_file_with_interner(self):
+        # Given
+        lines = [
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000}, {"operation":"buy", "unit-cost":10.00, "quantity": 10000}]\n',
+            '[{"operation":"buy","unit-cost":10.00,"quantity":10000}, {"operation":"sell", "unit-cost":20.00, "quantity": 5000}]\n',
+            '\n'
+        ]
+        interner = OperationInterner()
+
+        # When
+        actual = OperationUtil.format_operations_file(lines, interner=interner)
+
+        # Then
+        self.assertEqual(actual, OperationUtil.format_operations_file(lines))
+        self.assertIs(actual[0][0], actual[0][1])
+        self.assertIs(actual[0][0], actual[1][0])
+        self.assertEqual(interner.stats(), {"hits": 1, "misses": 3, "size": 2, "hit_rate": 0.25})
+
+    def test_interned_operations_are_read_only(self):
+        # Given
+        lines = ['[{"operation":"buy", "unit-cost":10.00, "quantity": 10000}, {"operation":"buy", "unit-cost":10.00, "quantity": 10000}]']
+        actual = OperationUtil.format_operations_file(lines, interner=OperationInterner())
+
+        # When / Then
+        with self.assertRaises(AttributeError):
+            actual[0][0].quantity = 1
+        with self.assertRaises(AttributeError):
+            del actual[0][0].unit_cost
+        self.assertEqual(actual[0][1].quantity, 10000)
+
+    def test_interner_is_bounded(self):
+        # Given
+        lines = [
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 1}, {"operation":"buy", "unit-cost":10.00, "quantity": 2}]',
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 2}]'
+        ]
+        interner = OperationInterner(max_size=1)
+
+        # When
+        actual = OperationUtil.format_operations_file(lines, interner=interner)
+
+        # Then
+        self.assertEqual(actual[1][0].quantity, 2)
+        self.assertIsNot(actual[0][1], actual[1][0])
+        self.assertEqual(interner.stats()["size"], 1)
+        self.assertEqual(interner.stats()["hits"], 0)
+
+    def test_interner_does_not_cache_tokens_with_braces_in_strings(self):
+        # Given
+        stream = io.StringIO('[{"note":"}", "operation":"buy", "unit-cost":10.00, "quantity": 1}]')
+        interner = OperationInterner()
+
+        # When
+        actual = [list(operations) for operations in OperationUtil.stream_operations(stream, interner=interner)]
+
+        # Then
+        self.assertEqual(actual[0][0].quantity, 1)
+        self.assertEqual(interner.by_token, {})
+
+    def test_format_operations_file_with_interner_invalid_operation_type(self):
+        # Given
+        lines = [
+            '[{"operation":"invalid", "unit-cost":10.00, "quantity": 10000}]'
+        ]
+
+        # Then
+        with self.assertRaises(OperationProcessingError):
+            OperationUtil.format_operations_file(lines, interner=OperationInterner())
+
+    def test_format_operations_file_with_interner_reports_invalid_line(self):
+        # Given
+        lines = [
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000}]\n',
+            '[]\n',
+            '[{"operation":"invalid", "unit-cost":10.00, "quantity": 10000}]\n'
+        ]
+
+        for interner in (None, OperationInterner()):
+            # Then
+            with self.assertRaises(OperationProcessingError) as context:
+                OperationUtil.format_operations_file(lines, interner=interner)
+            self.assertEqual(str(context.exception), f"Invalid input: {lines[2].strip()}")
+
+    def test_stream_operations_reports_line_number(self):
+        # Given
+        stream = io.StringIO(
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000}]\n'
+            '\n'
+            '[]\n'
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000}'
+        )
+
+        # Then
+        with self.assertRaisesRegex(OperationProcessingError, "line 4"):
+            for operations in OperationUtil.stream_operations(stream, chunk_size=7):
+                list(operations)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,77 @@
+import os
+import pstats
+import tempfile
+import unittest
+from src.main.utils.profile_util import Profiler, ProfileUtil
+from src.main.services.tax_service import TaxService
+from src.main.dto.operation_dto import OperationDto, OperationTypeEnum
+
+
+def calculate() -> None:
+    operations = [
+        OperationDto(OperationTypeEnum.BUY, 10.00, 10000),
+        OperationDto(OperationTypeEnum.SELL, 20.00, 5000)
+    ] * 500
+    TaxService().calculate_taxes(operations)
+
+
+class TestProfileUtil(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.prefix = os.path.join(self.directory.name, "profile")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_profiler_writes_pstats_and_collapsed_stacks(self):
+        # Given
+        profiler = Profiler(self.prefix)
+
+        # When
+        profiler.start()
+        calculate()
+        paths = profiler.stop()
+
+        # Then
+        self.assertEqual(paths, [self.prefix + ".pstats", self.prefix + ".collapsed"])
+        self.assertTrue(pstats.Stats(paths[0]).total_calls > 0)
+        with open(paths[1]) as collapsed_file:
+            lines = collapsed_file.read().splitlines()
+        self.assertTrue(lines)
+        for line in lines:
+            stack, value = line.rsplit(" ", 1)
+            self.assertNotIn(" ", stack)
+            self.assertGreater(int(value), 0)
+        self.assertTrue(any("calculate_taxes" in line and "calculate_tax)" in line for line in lines))
+
+    def test_profiler_writes_memory_snapshots_per_stage(self):
+        # Given
+        profiler = Profiler(self.prefix, trace_memory=True)
+
+        # When
+        profiler.start()
+        calculate()
+        profiler.stage("calculate")
+        data = [bytearray(1024) for _ in range(100)]
+        profiler.stage("allocate")
+        paths = profiler.stop()
+
+        # Then
+        self.assertEqual(len(data), 100)
+        with open(paths[2]) as memory_file:
+            report = memory_file.read()
+        self.assertIn("== calculate:", report)
+        self.assertIn("== allocate:", report)
+
+    def test_format_function(self):
+        # Then
+        self.assertEqual(ProfileUtil.format_function(
+            ("/project/src/main/services/tax_service.py", 72, "calculate_tax")),
+            "tax_service.py:72(calculate_tax)")
+        self.assertEqual(ProfileUtil.format_function(
+            ("~", 0, "<built-in method builtins.round>")),
+            "<built-in_method_builtins.round>")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import bz2
+import gzip
+import io
+import lzma
+import unittest
+from src.main.utils.stream_util import StreamUtil
+
+LINES = (
+    '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000}]\n'
+    '[{"operation":"sell", "unit-cost":20.00, "quantity": 5000}]\n'
+)
+
+
+class ShortReader(io.RawIOBase):
+    """
+    Raw reader returning at most 1 or 2 bytes per read, like a pipe written in small pieces.
+    """
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.reads = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        self.reads += 1
+        size = min(len(buffer), 1 + self.reads % 2, len(self.data))
+        buffer[:size] = self.data[:size]
+        self.data = self.data[size:]
+        return size
+
+
+class TestStreamUtil(unittest.TestCase):
+    def test_detect_compression(self):
+        # Then
+        self.assertEqual(StreamUtil.detect_compression(
+            gzip.compress(b"x")[:6]), "gzip")
+        self.assertEqual(StreamUtil.detect_compression(
+            bz2.compress(b"x")[:6]), "bz2")
+        self.assertEqual(StreamUtil.detect_compression(
+            lzma.compress(b"x")[:6]), "xz")
+        self.assertIsNone(StreamUtil.detect_compression(b"[{\"op"))
+
+    def test_open_input_plain_and_compressed(self):
+        for compress in (lambda data: data, gzip.compress, bz2.compress, lzma.compress):
+            # Given
+            binary_stream = io.BytesIO(compress(LINES.encode()))
+
+            # When
+            actual = StreamUtil.open_input(binary_stream).readlines()
+
+            # Then
+            self.assertEqual(actual, LINES.splitlines(keepends=True))
+
+    def test_open_input_with_short_reads(self):
+        for compress in (lambda data: data, gzip.compress, bz2.compress, lzma.compress):
+            for binary_stream in (ShortReader(compress(LINES.encode())),
+                                  io.BufferedReader(ShortReader(compress(LINES.encode())))):
+                # When
+                actual = StreamUtil.open_input(binary_stream).readlines()
+
+                # Then
+                self.assertEqual(actual, LINES.splitlines(keepends=True))
+
+    def test_open_output_compressed(self):
+        for compression, decompress in (("gzip", gzip.decompress), ("bz2", bz2.decompress),
+                                        ("xz", lzma.decompress)):
+            # Given
+            binary_stream = io.BytesIO()
+
+            # When
+            output = StreamUtil.open_output(binary_stream, compression)
+            output.write(LINES)
+            output.close()
+
+            # Then
+            self.assertFalse(binary_stream.closed)
+            self.assertEqual(decompress(binary_stream.getvalue()).decode(), LINES)
+
+    def test_open_output_plain(self):
+        # Given
+        binary_stream = io.BytesIO()
+
+        # When
+        output = StreamUtil.open_output(binary_stream)
+        output.write(LINES)
+        output.close()
+
+        # Then
+        self.assertEqual(binary_stream.getvalue().decode(), LINES)
+
+    def test_open_output_invalid_compression(self):
+        # Then
+        with self.assertRaises(ValueError):
+            StreamUtil.open_output(io.BytesIO(), "zip")
+
+
+if __name__ == "__main__":
+    unittest.main()